@@ -14,39 +14,66 @@ Key improvements included:
 """
 
 import asyncio
+import functools
+import importlib.util
+import itertools
+import io
 import json
 import logging
 import os
 import sys
 import tempfile
-from typing import Any, Dict, List, Optional
-import platform
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+# Configure logging (PPT_MCP_LOG_LEVEL=WARNING silences the per-operation info logs)
+# getLevelName maps a known level name to its number and anything else to a "Level ..." string
+_LOG_LEVEL = logging.getLevelName(os.environ.get("PPT_MCP_LOG_LEVEL", "INFO").upper())
+if not isinstance(_LOG_LEVEL, int):
+    _LOG_LEVEL = logging.INFO
+logging.basicConfig(level=_LOG_LEVEL, stream=sys.stderr)
 logger = logging.getLogger("powerpoint-mcp-stable")
 
-# Windows-specific COM imports for screenshot functionality
-if platform.system() == "Windows":
-    try:
-        import win32com.client
-        import pythoncom
-        WIN32_COM_AVAILABLE = True
-    except ImportError:
-        WIN32_COM_AVAILABLE = False
+# Windows-specific COM modules for screenshot functionality.
+# Only check they are installed here; they are imported on the first screenshot.
+win32com = None
+pythoncom = None
+if sys.platform == "win32":
+    WIN32_COM_AVAILABLE = importlib.util.find_spec("win32com") is not None
+    if not WIN32_COM_AVAILABLE:
         logger.warning("win32com not available - screenshot functionality will be disabled")
 else:
     WIN32_COM_AVAILABLE = False
 
+def _import_win32com():
+    """Import the COM modules on first use and keep them in module globals"""
+    global win32com, pythoncom
+    if pythoncom is None:
+        import win32com.client
+        import pythoncom
+
+# Optional faster JSON encoder for large tool results
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Core dependencies only
 try:
     from pptx import Presentation
-    from pptx.util import Inches, Pt
+    from pptx.util import Inches, Length, Pt
     from pptx.dml.color import RGBColor
     from pptx.enum.text import PP_ALIGN
     from pptx.chart.data import CategoryChartData
     from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.exc import PackageNotFoundError
+    from pptx.shapes.autoshape import Shape as AutoShape
+    from pptx.shapes.picture import Picture
 except ImportError as e:
     print(f"python-pptx library not found: {e}")
     print("Please install with: pip install python-pptx")
@@ -66,6 +93,215 @@ except ImportError as e:
 # SIMPLIFIED INPUT VALIDATION (No Pydantic dependency)
 # =============================================================================
 
+# Allowed values, shared by the validators and their error messages
+_VALID_TEXT_ALIGNMENTS = ["left", "center", "right", "justify"]
+_VALID_CHART_TYPES = ["column", "bar", "line", "pie", "area"]
+_VALID_TABLE_OPERATIONS = ["add_row", "remove_row", "add_column", "remove_column"]
+
+def _validate_add_text_box(arguments: Dict[str, Any]) -> None:
+    text = arguments.get("text", "")
+    if not text or not isinstance(text, str):
+        raise ValueError("text must be a non-empty string")
+    
+    font_size = arguments.get("font_size", 18)
+    if not isinstance(font_size, int) or font_size < 8 or font_size > 72:
+        raise ValueError("font_size must be between 8 and 72")
+    
+    font_name = arguments.get("font_name", "Calibri")
+    if not isinstance(font_name, str):
+        raise ValueError("font_name must be a string")
+    
+    text_alignment = arguments.get("text_alignment", "left")
+    if text_alignment.lower() not in _VALID_TEXT_ALIGNMENTS:
+        raise ValueError(f"text_alignment must be one of: {_VALID_TEXT_ALIGNMENTS}")
+    
+    border_width = arguments.get("border_width", 0)
+    if not isinstance(border_width, (int, float)) or border_width < 0:
+        raise ValueError("border_width must be a non-negative number")
+
+def _validate_add_image(arguments: Dict[str, Any]) -> None:
+    image_source = arguments.get("image_source", "")
+    if not image_source or not isinstance(image_source, str):
+        raise ValueError("image_source must be a non-empty string")
+
+def _validate_add_chart(arguments: Dict[str, Any]) -> None:
+    chart_type = arguments.get("chart_type", "")
+    if chart_type not in _VALID_CHART_TYPES:
+        raise ValueError(f"chart_type must be one of: {_VALID_CHART_TYPES}")
+    
+    categories = arguments.get("categories", [])
+    if not categories or not isinstance(categories, list):
+        raise ValueError("categories must be a non-empty list")
+    
+    series_data = arguments.get("series_data", {})
+    if not series_data or not isinstance(series_data, dict):
+        raise ValueError("series_data must be a non-empty dictionary")
+
+def _validate_file_path(arguments: Dict[str, Any]) -> None:
+    file_path = arguments.get("file_path", "")
+    if not file_path or not isinstance(file_path, str):
+        raise ValueError("file_path must be a non-empty string")
+
+def _validate_add_slide(arguments: Dict[str, Any]) -> None:
+    layout_index = arguments.get("layout_index", 6)
+    if not isinstance(layout_index, int) or layout_index < 0:
+        raise ValueError("layout_index must be a non-negative integer")
+
+def _validate_shape_index(arguments: Dict[str, Any]) -> None:
+    shape_index = arguments.get("shape_index")
+    if shape_index is None or not isinstance(shape_index, int) or shape_index < 0:
+        raise ValueError("shape_index must be a non-negative integer")
+
+def _validate_format_existing_text(arguments: Dict[str, Any]) -> None:
+    _validate_shape_index(arguments)
+    
+    # Validate formatting parameters if provided
+    font_size = arguments.get("font_size")
+    if font_size is not None and (not isinstance(font_size, int) or font_size < 8 or font_size > 72):
+        raise ValueError("font_size must be between 8 and 72")
+    
+    text_alignment = arguments.get("text_alignment")
+    if text_alignment is not None and text_alignment.lower() not in _VALID_TEXT_ALIGNMENTS:
+        raise ValueError(f"text_alignment must be one of: {_VALID_TEXT_ALIGNMENTS}")
+
+def _validate_set_slide_background(arguments: Dict[str, Any]) -> None:
+    background_color = arguments.get("background_color")
+    background_image = arguments.get("background_image")
+    if not background_color and not background_image:
+        raise ValueError("Either background_color or background_image must be provided")
+
+# Table-specific validation
+def _validate_add_table(arguments: Dict[str, Any]) -> None:
+    rows = arguments.get("rows")
+    cols = arguments.get("cols")
+    if not isinstance(rows, int) or rows < 1 or rows > 50:
+        raise ValueError("rows must be between 1 and 50")
+    if not isinstance(cols, int) or cols < 1 or cols > 20:
+        raise ValueError("cols must be between 1 and 20")
+
+def _validate_table_index(arguments: Dict[str, Any]) -> None:
+    table_index = arguments.get("table_index")
+    if table_index is None or not isinstance(table_index, int) or table_index < 0:
+        raise ValueError("table_index must be a non-negative integer")
+
+def _validate_table_cell(arguments: Dict[str, Any]) -> None:
+    _validate_table_index(arguments)
+    
+    row = arguments.get("row")
+    col = arguments.get("col") 
+    if row is None or not isinstance(row, int) or row < 0:
+        raise ValueError("row must be a non-negative integer")
+    if col is None or not isinstance(col, int) or col < 0:
+        raise ValueError("col must be a non-negative integer")
+
+def _validate_set_table_cell(arguments: Dict[str, Any]) -> None:
+    _validate_table_cell(arguments)
+    
+    text = arguments.get("text", "")
+    if not isinstance(text, str):
+        raise ValueError("text must be a string")
+
+def _validate_style_table_range(arguments: Dict[str, Any]) -> None:
+    _validate_table_index(arguments)
+        
+    # Range validation
+    start_row = arguments.get("start_row")
+    end_row = arguments.get("end_row")
+    start_col = arguments.get("start_col")
+    end_col = arguments.get("end_col")
+    
+    if start_row is None or not isinstance(start_row, int) or start_row < 0:
+        raise ValueError("start_row must be a non-negative integer")
+    if end_row is None or not isinstance(end_row, int) or end_row < 0:
+        raise ValueError("end_row must be a non-negative integer")
+    if start_col is None or not isinstance(start_col, int) or start_col < 0:
+        raise ValueError("start_col must be a non-negative integer")
+    if end_col is None or not isinstance(end_col, int) or end_col < 0:
+        raise ValueError("end_col must be a non-negative integer")
+        
+    if start_row > end_row:
+        raise ValueError("start_row must be <= end_row")
+    if start_col > end_col:
+        raise ValueError("start_col must be <= end_col")
+
+def _validate_create_table_with_data(arguments: Dict[str, Any]) -> None:
+    table_data = arguments.get("table_data", [])
+    if not isinstance(table_data, list) or not table_data:
+        raise ValueError("table_data must be a non-empty list")
+    
+    # Same limits as add_table, checked before walking the rows
+    headers = arguments.get("headers")
+    total_rows = len(table_data) + (1 if headers else 0)
+    if total_rows > 50:
+        raise ValueError(f"table_data must have at most 50 rows including headers, got {total_rows}")
+    
+    if not all(isinstance(row, list) for row in table_data):
+        raise ValueError("table_data must be a list of lists")
+    
+    if not table_data[0]:
+        raise ValueError("table_data rows cannot be empty")
+    
+    # Check consistent row lengths
+    expected_cols = len(table_data[0])
+    for i, row in enumerate(table_data):
+        if len(row) != expected_cols:
+            raise ValueError(f"All rows must have the same number of columns. Row {i} has {len(row)} columns, expected {expected_cols}")
+    
+    if expected_cols > 20:
+        raise ValueError(f"table_data must have at most 20 columns, got {expected_cols}")
+    
+    # Validate headers if provided
+    if headers is not None:
+        if not isinstance(headers, list):
+            raise ValueError("headers must be a list")
+        if len(headers) != expected_cols:
+            raise ValueError(f"headers length ({len(headers)}) must match table columns ({expected_cols})")
+    
+    # Validate style objects if provided
+    header_style = arguments.get("header_style")
+    if header_style is not None and not isinstance(header_style, dict):
+        raise ValueError("header_style must be a dictionary")
+    
+    data_style = arguments.get("data_style")
+    if data_style is not None and not isinstance(data_style, dict):
+        raise ValueError("data_style must be a dictionary")
+
+def _validate_modify_table_structure(arguments: Dict[str, Any]) -> None:
+    _validate_table_index(arguments)
+    
+    operation = arguments.get("operation")
+    if operation not in _VALID_TABLE_OPERATIONS:
+        raise ValueError(f"operation must be one of: {_VALID_TABLE_OPERATIONS}")
+    
+    position = arguments.get("position")
+    if position is not None and (not isinstance(position, int) or position < 0):
+        raise ValueError("position must be a non-negative integer")
+    
+    count = arguments.get("count", 1)
+    if not isinstance(count, int) or count < 1 or count > 20:
+        raise ValueError("count must be between 1 and 20")
+
+# Tool-specific validators, looked up once per call instead of walking an if/elif chain.
+# Tools without an entry need nothing beyond the shared presentation_id/slide_index checks.
+_TOOL_VALIDATORS = {
+    "add_text_box": _validate_add_text_box,
+    "add_image": _validate_add_image,
+    "add_chart": _validate_add_chart,
+    "save_presentation": _validate_file_path,
+    "load_presentation": _validate_file_path,
+    "add_slide": _validate_add_slide,
+    "delete_shape": _validate_shape_index,
+    "format_existing_text": _validate_format_existing_text,
+    "set_slide_background": _validate_set_slide_background,
+    "add_table": _validate_add_table,
+    "set_table_cell": _validate_set_table_cell,
+    "style_table_cell": _validate_table_cell,
+    "style_table_range": _validate_style_table_range,
+    "get_table_info": _validate_table_index,
+    "create_table_with_data": _validate_create_table_with_data,
+    "modify_table_structure": _validate_modify_table_structure,
+}
+
 def validate_basic_args(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Basic input validation without external dependencies"""
     
@@ -81,230 +317,9 @@ def validate_basic_args(tool_name: str, arguments: Dict[str, Any]) -> Dict[str,
             raise ValueError("slide_index must be a non-negative integer")
     
     # Tool-specific validation
-    if tool_name == "add_text_box":
-        text = arguments.get("text", "")
-        if not text or not isinstance(text, str):
-            raise ValueError("text must be a non-empty string")
-        
-        font_size = arguments.get("font_size", 18)
-        if not isinstance(font_size, int) or font_size < 8 or font_size > 72:
-            raise ValueError("font_size must be between 8 and 72")
-        
-        font_name = arguments.get("font_name", "Calibri")
-        if not isinstance(font_name, str):
-            raise ValueError("font_name must be a string")
-        
-        text_alignment = arguments.get("text_alignment", "left")
-        valid_alignments = ["left", "center", "right", "justify"]
-        if text_alignment.lower() not in valid_alignments:
-            raise ValueError(f"text_alignment must be one of: {valid_alignments}")
-        
-        border_width = arguments.get("border_width", 0)
-        if not isinstance(border_width, (int, float)) or border_width < 0:
-            raise ValueError("border_width must be a non-negative number")
-    
-    elif tool_name == "add_image":
-        image_source = arguments.get("image_source", "")
-        if not image_source or not isinstance(image_source, str):
-            raise ValueError("image_source must be a non-empty string")
-    
-    elif tool_name == "add_chart":
-        chart_type = arguments.get("chart_type", "")
-        valid_types = ["column", "bar", "line", "pie", "area"]
-        if chart_type not in valid_types:
-            raise ValueError(f"chart_type must be one of: {valid_types}")
-        
-        categories = arguments.get("categories", [])
-        if not categories or not isinstance(categories, list):
-            raise ValueError("categories must be a non-empty list")
-        
-        series_data = arguments.get("series_data", {})
-        if not series_data or not isinstance(series_data, dict):
-            raise ValueError("series_data must be a non-empty dictionary")
-    
-    elif tool_name == "save_presentation":
-        file_path = arguments.get("file_path", "")
-        if not file_path or not isinstance(file_path, str):
-            raise ValueError("file_path must be a non-empty string")
-    
-    elif tool_name == "load_presentation":
-        file_path = arguments.get("file_path", "")
-        if not file_path or not isinstance(file_path, str):
-            raise ValueError("file_path must be a non-empty string")
-    
-    elif tool_name == "add_slide":
-        layout_index = arguments.get("layout_index", 6)
-        if not isinstance(layout_index, int) or layout_index < 0:
-            raise ValueError("layout_index must be a non-negative integer")
-    
-    elif tool_name == "extract_text":
-        # No additional validation needed beyond presentation_id
-        pass
-    
-    elif tool_name == "get_presentation_info":
-        # No additional validation needed beyond presentation_id
-        pass
-    
-    elif tool_name == "delete_shape":
-        shape_index = arguments.get("shape_index")
-        if shape_index is None or not isinstance(shape_index, int) or shape_index < 0:
-            raise ValueError("shape_index must be a non-negative integer")
-    
-    elif tool_name == "delete_slide":
-        # slide_index validation already handled above
-        pass
-    
-    elif tool_name == "clear_slide":
-        # slide_index validation already handled above  
-        pass
-    
-    elif tool_name == "list_slide_content":
-        # slide_index validation already handled above
-        pass
-    
-    elif tool_name == "format_existing_text":
-        shape_index = arguments.get("shape_index")
-        if shape_index is None or not isinstance(shape_index, int) or shape_index < 0:
-            raise ValueError("shape_index must be a non-negative integer")
-        
-        # Validate formatting parameters if provided
-        font_size = arguments.get("font_size")
-        if font_size is not None and (not isinstance(font_size, int) or font_size < 8 or font_size > 72):
-            raise ValueError("font_size must be between 8 and 72")
-        
-        text_alignment = arguments.get("text_alignment")
-        if text_alignment is not None:
-            valid_alignments = ["left", "center", "right", "justify"]
-            if text_alignment.lower() not in valid_alignments:
-                raise ValueError(f"text_alignment must be one of: {valid_alignments}")
-    
-    elif tool_name == "set_slide_background":
-        background_color = arguments.get("background_color")
-        background_image = arguments.get("background_image")
-        if not background_color and not background_image:
-            raise ValueError("Either background_color or background_image must be provided")
-    
-    # Table-specific validation
-    elif tool_name == "add_table":
-        rows = arguments.get("rows")
-        cols = arguments.get("cols")
-        if not isinstance(rows, int) or rows < 1 or rows > 50:
-            raise ValueError("rows must be between 1 and 50")
-        if not isinstance(cols, int) or cols < 1 or cols > 20:
-            raise ValueError("cols must be between 1 and 20")
-            
-    elif tool_name in ["set_table_cell", "style_table_cell"]:
-        table_index = arguments.get("table_index")
-        if table_index is None or not isinstance(table_index, int) or table_index < 0:
-            raise ValueError("table_index must be a non-negative integer")
-        
-        row = arguments.get("row")
-        col = arguments.get("col") 
-        if row is None or not isinstance(row, int) or row < 0:
-            raise ValueError("row must be a non-negative integer")
-        if col is None or not isinstance(col, int) or col < 0:
-            raise ValueError("col must be a non-negative integer")
-        
-        if tool_name == "set_table_cell":
-            text = arguments.get("text", "")
-            if not isinstance(text, str):
-                raise ValueError("text must be a string")
-                
-    elif tool_name == "style_table_range":
-        table_index = arguments.get("table_index")
-        if table_index is None or not isinstance(table_index, int) or table_index < 0:
-            raise ValueError("table_index must be a non-negative integer")
-            
-        # Range validation
-        start_row = arguments.get("start_row")
-        end_row = arguments.get("end_row")
-        start_col = arguments.get("start_col")
-        end_col = arguments.get("end_col")
-        
-        if start_row is None or not isinstance(start_row, int) or start_row < 0:
-            raise ValueError("start_row must be a non-negative integer")
-        if end_row is None or not isinstance(end_row, int) or end_row < 0:
-            raise ValueError("end_row must be a non-negative integer")
-        if start_col is None or not isinstance(start_col, int) or start_col < 0:
-            raise ValueError("start_col must be a non-negative integer")
-        if end_col is None or not isinstance(end_col, int) or end_col < 0:
-            raise ValueError("end_col must be a non-negative integer")
-            
-        if start_row > end_row:
-            raise ValueError("start_row must be <= end_row")
-        if start_col > end_col:
-            raise ValueError("start_col must be <= end_col")
-            
-    elif tool_name == "modify_table_structure":
-        table_index = arguments.get("table_index")
-        if table_index is None or not isinstance(table_index, int) or table_index < 0:
-            raise ValueError("table_index must be a non-negative integer")
-            
-        action = arguments.get("action")
-        valid_actions = ["add_row", "delete_row", "add_column", "delete_column"]
-        if action not in valid_actions:
-            raise ValueError(f"action must be one of: {valid_actions}")
-            
-        index = arguments.get("index")
-        if index is None or not isinstance(index, int) or index < 0:
-            raise ValueError("index must be a non-negative integer")
-    
-    elif tool_name == "get_table_info":
-        table_index = arguments.get("table_index")
-        if table_index is None or not isinstance(table_index, int) or table_index < 0:
-            raise ValueError("table_index must be a non-negative integer")
-    
-    elif tool_name == "create_table_with_data":
-        table_data = arguments.get("table_data", [])
-        if not isinstance(table_data, list) or not table_data:
-            raise ValueError("table_data must be a non-empty list")
-        
-        if not all(isinstance(row, list) for row in table_data):
-            raise ValueError("table_data must be a list of lists")
-        
-        if not table_data[0]:
-            raise ValueError("table_data rows cannot be empty")
-        
-        # Check consistent row lengths
-        expected_cols = len(table_data[0])
-        for i, row in enumerate(table_data):
-            if len(row) != expected_cols:
-                raise ValueError(f"All rows must have the same number of columns. Row {i} has {len(row)} columns, expected {expected_cols}")
-        
-        # Validate headers if provided
-        headers = arguments.get("headers")
-        if headers is not None:
-            if not isinstance(headers, list):
-                raise ValueError("headers must be a list")
-            if len(headers) != expected_cols:
-                raise ValueError(f"headers length ({len(headers)}) must match table columns ({expected_cols})")
-        
-        # Validate style objects if provided
-        header_style = arguments.get("header_style")
-        if header_style is not None and not isinstance(header_style, dict):
-            raise ValueError("header_style must be a dictionary")
-        
-        data_style = arguments.get("data_style")
-        if data_style is not None and not isinstance(data_style, dict):
-            raise ValueError("data_style must be a dictionary")
-    
-    elif tool_name == "modify_table_structure":
-        table_index = arguments.get("table_index")
-        if table_index is None or not isinstance(table_index, int) or table_index < 0:
-            raise ValueError("table_index must be a non-negative integer")
-        
-        operation = arguments.get("operation")
-        valid_operations = ["add_row", "remove_row", "add_column", "remove_column"]
-        if operation not in valid_operations:
-            raise ValueError(f"operation must be one of: {valid_operations}")
-        
-        position = arguments.get("position")
-        if position is not None and (not isinstance(position, int) or position < 0):
-            raise ValueError("position must be a non-negative integer")
-        
-        count = arguments.get("count", 1)
-        if not isinstance(count, int) or count < 1 or count > 20:
-            raise ValueError("count must be between 1 and 20")
+    validator = _TOOL_VALIDATORS.get(tool_name)
+    if validator is not None:
+        validator(arguments)
     
     return arguments
 
@@ -312,192 +327,272 @@ def validate_basic_args(tool_name: str, arguments: Dict[str, Any]) -> Dict[str,
 # ENHANCED SUCCESS MESSAGES
 # =============================================================================
 
+def _success_add_text_box(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    font_size = kwargs.get('font_size', 18)
+    font_name = kwargs.get('font_name', 'Calibri')
+    text_alignment = kwargs.get('text_alignment', 'left')
+    font_color = kwargs.get('font_color')
+    fill_color = kwargs.get('fill_color')
+    text = kwargs.get('text', '')
+    text_preview = text[:40] + ('...' if len(text) > 40 else '')
+    
+    # Build formatting description
+    format_desc = f"{font_size}pt {font_name}, {text_alignment} aligned"
+    if font_color:
+        format_desc += f", color: {font_color}"
+    if fill_color:
+        format_desc += f", background: {fill_color}"
+    
+    return f"✅ Added formatted text box to slide {slide_idx + 1}: \"{text_preview}\" ({format_desc})"
+
+def _success_add_image(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    image_source = kwargs.get('image_source', '')
+    image_name = os.path.basename(image_source) if image_source else 'image'
+    return f"✅ Added image to slide {slide_idx + 1}: {image_name}"
+
+def _success_add_chart(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    chart_type = kwargs.get('chart_type', 'chart')
+    categories = kwargs.get('categories', [])
+    series_data = kwargs.get('series_data', {})
+    return f"✅ Added {chart_type} chart to slide {slide_idx + 1}: {len(categories)} categories, {len(series_data)} series"
+
+def _success_save_presentation(kwargs: Dict[str, Any]) -> str:
+    file_path = kwargs.get('file_path', '')
+    if file_path:
+        # Show both filename and full path for clarity
+        file_name = os.path.basename(file_path)
+        # Normalize path for display
+        display_path = os.path.normpath(file_path)
+        
+        # Check if it's in Documents folder and mention it prominently
+        if "Documents" in display_path:
+            return f"✅ Saved presentation: {file_name}\n📁 Location: Documents folder\n📍 Full path: {display_path}"
+        else:
+            # Truncate very long paths for readability but keep them informative
+            if len(display_path) > 80:
+                display_path = f"...{display_path[-77:]}"
+            return f"✅ Saved presentation: {file_name}\n📁 Full path: {display_path}"
+    return f"✅ Saved presentation → Ready for use!"
+
+def _success_create_presentation(kwargs: Dict[str, Any]) -> str:
+    prs_id = kwargs.get('presentation_id', 'new')
+    return f"✅ Created presentation {prs_id} → Ready to add slides!"
+
+def _success_load_presentation(kwargs: Dict[str, Any]) -> str:
+    prs_id = kwargs.get('presentation_id', 'loaded')
+    file_path = kwargs.get('file_path', '')
+    file_name = os.path.basename(file_path) if file_path else 'presentation'
+    slide_count = kwargs.get('slide_count', 'unknown')
+    return f"📂 Loaded presentation {prs_id} from {file_name} → {slide_count} slides available"
+
+def _success_add_slide(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    layout_idx = kwargs.get('layout_index', 6)
+    layout_name = kwargs.get('layout_name', f'Layout {layout_idx}')
+    total_slides = kwargs.get('total_slides', 'unknown')
+    return f"➕ Added slide {slide_idx + 1} using {layout_name} → {total_slides} slides total"
+
+def _success_extract_text(kwargs: Dict[str, Any]) -> str:
+    slide_count = kwargs.get('slide_count', 0)
+    text_items = kwargs.get('text_items', 0)
+    return f"📝 Extracted text from {slide_count} slides → Found {text_items} text items"
+
+def _success_get_presentation_info(kwargs: Dict[str, Any]) -> str:
+    slide_count = kwargs.get('slide_count', 0)
+    total_shapes = kwargs.get('total_shapes', 0)
+    return f"ℹ️ Presentation info: {slide_count} slides, {total_shapes} total shapes"
+
+def _success_delete_shape(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    shape_idx = kwargs.get('shape_index', 0)
+    shape_type = kwargs.get('shape_type', 'shape')
+    return f"🗑️ Deleted {shape_type} (index {shape_idx}) from slide {slide_idx + 1}"
+
+def _success_delete_slide(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    remaining_slides = kwargs.get('remaining_slides', 'unknown')
+    return f"🗑️ Deleted slide {slide_idx + 1} → {remaining_slides} slides remaining"
+
+def _success_clear_slide(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    shapes_cleared = kwargs.get('shapes_cleared', 0)
+    return f"🧹 Cleared slide {slide_idx + 1} → Removed {shapes_cleared} shapes"
+
+def _success_list_slide_content(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    shape_count = kwargs.get('shape_count', 0)
+    return f"📋 Slide {slide_idx + 1} contents: {shape_count} shapes found"
+
+def _success_format_existing_text(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    shape_idx = kwargs.get('shape_index', 0)
+    font_size = kwargs.get('font_size')
+    font_name = kwargs.get('font_name')
+    font_color = kwargs.get('font_color')
+    text_alignment = kwargs.get('text_alignment')
+    formatted_props = []
+    if font_size:
+        formatted_props.append(f"size: {font_size}pt")
+    if font_name:
+        formatted_props.append(f"font: {font_name}")
+    if font_color:
+        formatted_props.append(f"color: {font_color}")
+    if text_alignment:
+        formatted_props.append(f"align: {text_alignment}")
+    props_desc = ", ".join(formatted_props) if formatted_props else "basic formatting"
+    return f"🎨 Updated text formatting for shape {shape_idx} on slide {slide_idx + 1}: {props_desc}"
+
+def _success_set_slide_background(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    bg_color = kwargs.get('background_color')
+    bg_image = kwargs.get('background_image')
+    if bg_color:
+        return f"🎨 Set slide {slide_idx + 1} background color: {bg_color}"
+    elif bg_image:
+        return f"🎨 Set slide {slide_idx + 1} background image: {os.path.basename(bg_image)}"
+    return f"🎨 Updated slide {slide_idx + 1} background"
+
+# Table-specific success messages
+def _success_add_table(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    rows = kwargs.get('rows', 0)
+    cols = kwargs.get('cols', 0)
+    header_row = kwargs.get('header_row', False)
+    header_note = " (with header)" if header_row else ""
+    return f"📊 Added {rows}×{cols} table to slide {slide_idx + 1}{header_note}"
+
+def _success_set_table_cell(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    table_idx = kwargs.get('table_index', 0)
+    row = kwargs.get('row', 0)
+    col = kwargs.get('col', 0)
+    text = kwargs.get('text', '')
+    text_preview = text[:30] + ('...' if len(text) > 30 else '')
+    return f"✅ Updated table {table_idx} cell [{row},{col}] on slide {slide_idx + 1}: \"{text_preview}\""
+
+def _success_style_table_cell(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    table_idx = kwargs.get('table_index', 0)
+    row = kwargs.get('row', 0)
+    col = kwargs.get('col', 0)
+    fill_color = kwargs.get('fill_color')
+    border_color = kwargs.get('border_color')
+    style_changes = []
+    if fill_color:
+        style_changes.append(f"fill: {fill_color}")
+    if border_color:
+        style_changes.append(f"border: {border_color}")
+    style_desc = f" ({', '.join(style_changes)})" if style_changes else ""
+    return f"🎨 Styled table {table_idx} cell [{row},{col}] on slide {slide_idx + 1}{style_desc}"
+
+def _success_style_table_range(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    table_idx = kwargs.get('table_index', 0)
+    start_row = kwargs.get('start_row', 0)
+    start_col = kwargs.get('start_col', 0)
+    end_row = kwargs.get('end_row', 0)
+    end_col = kwargs.get('end_col', 0)
+    cell_count = (end_row - start_row + 1) * (end_col - start_col + 1)
+    return f"🎨 Styled table {table_idx} range [{start_row},{start_col}] to [{end_row},{end_col}] on slide {slide_idx + 1} ({cell_count} cells)"
+
+def _success_modify_table_structure(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    table_idx = kwargs.get('table_index', 0)
+    operation = kwargs.get('operation', '')
+    position = kwargs.get('position', 0)
+    count = kwargs.get('count', 1)
+    operation_desc = operation.replace('_', ' ')
+    count_desc = f" ({count} {'rows' if 'row' in operation else 'columns'})" if count > 1 else ""
+    return f"🔧 Table {table_idx} on slide {slide_idx + 1}: {operation_desc} at position {position}{count_desc}"
+
+def _success_get_table_info(kwargs: Dict[str, Any]) -> str:
+    slide_idx = kwargs.get('slide_index', 0)
+    table_idx = kwargs.get('table_index', 0)
+    rows = kwargs.get('rows', 0)
+    cols = kwargs.get('cols', 0)
+    total_cells = kwargs.get('total_cells', 0)
+    return f"ℹ️ Table {table_idx} info on slide {slide_idx + 1}: {rows}×{cols} table with {total_cells} cells"
+
+# Tool name -> success message builder, looked up once per call
+_SUCCESS_FORMATTERS = {
+    "add_text_box": _success_add_text_box,
+    "add_image": _success_add_image,
+    "add_chart": _success_add_chart,
+    "save_presentation": _success_save_presentation,
+    "create_presentation": _success_create_presentation,
+    "load_presentation": _success_load_presentation,
+    "add_slide": _success_add_slide,
+    "extract_text": _success_extract_text,
+    "get_presentation_info": _success_get_presentation_info,
+    "delete_shape": _success_delete_shape,
+    "delete_slide": _success_delete_slide,
+    "clear_slide": _success_clear_slide,
+    "list_slide_content": _success_list_slide_content,
+    "format_existing_text": _success_format_existing_text,
+    "set_slide_background": _success_set_slide_background,
+    "add_table": _success_add_table,
+    "set_table_cell": _success_set_table_cell,
+    "style_table_cell": _success_style_table_cell,
+    "style_table_range": _success_style_table_range,
+    "modify_table_structure": _success_modify_table_structure,
+    "get_table_info": _success_get_table_info,
+}
+
 def format_success_message(tool_name: str, **kwargs) -> str:
     """Generate specific, actionable success messages"""
-    
-    if tool_name == "add_text_box":
-        slide_idx = kwargs.get('slide_index', 0)
-        font_size = kwargs.get('font_size', 18)
-        font_name = kwargs.get('font_name', 'Calibri')
-        text_alignment = kwargs.get('text_alignment', 'left')
-        font_color = kwargs.get('font_color')
-        fill_color = kwargs.get('fill_color')
-        text_preview = kwargs.get('text', '')[:40] + ('...' if len(kwargs.get('text', '')) > 40 else '')
-        
-        # Build formatting description
-        format_desc = f"{font_size}pt {font_name}, {text_alignment} aligned"
-        if font_color:
-            format_desc += f", color: {font_color}"
-        if fill_color:
-            format_desc += f", background: {fill_color}"
-        
-        return f"✅ Added formatted text box to slide {slide_idx + 1}: \"{text_preview}\" ({format_desc})"
-    
-    elif tool_name == "add_image":
-        slide_idx = kwargs.get('slide_index', 0)
-        image_source = kwargs.get('image_source', '')
-        image_name = os.path.basename(image_source) if image_source else 'image'
-        return f"✅ Added image to slide {slide_idx + 1}: {image_name}"
-    
-    elif tool_name == "add_chart":
-        slide_idx = kwargs.get('slide_index', 0)
-        chart_type = kwargs.get('chart_type', 'chart')
-        categories = kwargs.get('categories', [])
-        series_data = kwargs.get('series_data', {})
-        return f"✅ Added {chart_type} chart to slide {slide_idx + 1}: {len(categories)} categories, {len(series_data)} series"
-    
-    elif tool_name == "save_presentation":
-        file_path = kwargs.get('file_path', '')
-        if file_path:
-            # Show both filename and full path for clarity
-            file_name = os.path.basename(file_path)
-            # Normalize path for display
-            display_path = os.path.normpath(file_path)
-            
-            # Check if it's in Documents folder and mention it prominently
-            if "Documents" in display_path:
-                return f"✅ Saved presentation: {file_name}\n📁 Location: Documents folder\n📍 Full path: {display_path}"
-            else:
-                # Truncate very long paths for readability but keep them informative
-                if len(display_path) > 80:
-                    display_path = f"...{display_path[-77:]}"
-                return f"✅ Saved presentation: {file_name}\n📁 Full path: {display_path}"
-        return f"✅ Saved presentation → Ready for use!"
-    
-    elif tool_name == "create_presentation":
-        prs_id = kwargs.get('presentation_id', 'new')
-        return f"✅ Created presentation {prs_id} → Ready to add slides!"
-    
-    elif tool_name == "load_presentation":
-        prs_id = kwargs.get('presentation_id', 'loaded')
-        file_path = kwargs.get('file_path', '')
-        file_name = os.path.basename(file_path) if file_path else 'presentation'
-        slide_count = kwargs.get('slide_count', 'unknown')
-        return f"📂 Loaded presentation {prs_id} from {file_name} → {slide_count} slides available"
-    
-    elif tool_name == "add_slide":
-        slide_idx = kwargs.get('slide_index', 0)
-        layout_idx = kwargs.get('layout_index', 6)
-        layout_name = kwargs.get('layout_name', f'Layout {layout_idx}')
-        total_slides = kwargs.get('total_slides', 'unknown')
-        return f"➕ Added slide {slide_idx + 1} using {layout_name} → {total_slides} slides total"
-    
-    elif tool_name == "extract_text":
-        slide_count = kwargs.get('slide_count', 0)
-        text_items = kwargs.get('text_items', 0)
-        return f"📝 Extracted text from {slide_count} slides → Found {text_items} text items"
-    
-    elif tool_name == "get_presentation_info":
-        slide_count = kwargs.get('slide_count', 0)
-        total_shapes = kwargs.get('total_shapes', 0)
-        return f"ℹ️ Presentation info: {slide_count} slides, {total_shapes} total shapes"
-    
-    elif tool_name == "delete_shape":
-        slide_idx = kwargs.get('slide_index', 0)
-        shape_idx = kwargs.get('shape_index', 0)
-        shape_type = kwargs.get('shape_type', 'shape')
-        return f"🗑️ Deleted {shape_type} (index {shape_idx}) from slide {slide_idx + 1}"
-    
-    elif tool_name == "delete_slide":
-        slide_idx = kwargs.get('slide_index', 0)
-        remaining_slides = kwargs.get('remaining_slides', 'unknown')
-        return f"🗑️ Deleted slide {slide_idx + 1} → {remaining_slides} slides remaining"
-    
-    elif tool_name == "clear_slide":
-        slide_idx = kwargs.get('slide_index', 0)
-        shapes_cleared = kwargs.get('shapes_cleared', 0)
-        return f"🧹 Cleared slide {slide_idx + 1} → Removed {shapes_cleared} shapes"
-    
-    elif tool_name == "list_slide_content":
-        slide_idx = kwargs.get('slide_index', 0)
-        shape_count = kwargs.get('shape_count', 0)
-        return f"📋 Slide {slide_idx + 1} contents: {shape_count} shapes found"
-    
-    elif tool_name == "format_existing_text":
-        slide_idx = kwargs.get('slide_index', 0)
-        shape_idx = kwargs.get('shape_index', 0)
-        formatted_props = []
-        if kwargs.get('font_size'):
-            formatted_props.append(f"size: {kwargs['font_size']}pt")
-        if kwargs.get('font_name'):
-            formatted_props.append(f"font: {kwargs['font_name']}")
-        if kwargs.get('font_color'):
-            formatted_props.append(f"color: {kwargs['font_color']}")
-        if kwargs.get('text_alignment'):
-            formatted_props.append(f"align: {kwargs['text_alignment']}")
-        props_desc = ", ".join(formatted_props) if formatted_props else "basic formatting"
-        return f"🎨 Updated text formatting for shape {shape_idx} on slide {slide_idx + 1}: {props_desc}"
-    
-    elif tool_name == "set_slide_background":
-        slide_idx = kwargs.get('slide_index', 0)
-        bg_color = kwargs.get('background_color')
-        bg_image = kwargs.get('background_image')
-        if bg_color:
-            return f"🎨 Set slide {slide_idx + 1} background color: {bg_color}"
-        elif bg_image:
-            image_name = os.path.basename(bg_image) if bg_image else 'image'
-            return f"🎨 Set slide {slide_idx + 1} background image: {image_name}"
-        return f"🎨 Updated slide {slide_idx + 1} background"
-    
-    # Table-specific success messages
-    elif tool_name == "add_table":
-        slide_idx = kwargs.get('slide_index', 0)
-        rows = kwargs.get('rows', 0)
-        cols = kwargs.get('cols', 0)
-        header_row = kwargs.get('header_row', False)
-        header_note = " (with header)" if header_row else ""
-        return f"📊 Added {rows}×{cols} table to slide {slide_idx + 1}{header_note}"
-    
-    elif tool_name == "set_table_cell":
-        slide_idx = kwargs.get('slide_index', 0)
-        table_idx = kwargs.get('table_index', 0)
-        row = kwargs.get('row', 0)
-        col = kwargs.get('col', 0)
-        text_preview = kwargs.get('text', '')[:30] + ('...' if len(kwargs.get('text', '')) > 30 else '')
-        return f"✅ Updated table {table_idx} cell [{row},{col}] on slide {slide_idx + 1}: \"{text_preview}\""
-    
-    elif tool_name == "style_table_cell":
-        slide_idx = kwargs.get('slide_index', 0)
-        table_idx = kwargs.get('table_index', 0)
-        row = kwargs.get('row', 0)
-        col = kwargs.get('col', 0)
-        style_changes = []
-        if kwargs.get('fill_color'):
-            style_changes.append(f"fill: {kwargs['fill_color']}")
-        if kwargs.get('border_color'):
-            style_changes.append(f"border: {kwargs['border_color']}")
-        style_desc = f" ({', '.join(style_changes)})" if style_changes else ""
-        return f"🎨 Styled table {table_idx} cell [{row},{col}] on slide {slide_idx + 1}{style_desc}"
-    
-    elif tool_name == "style_table_range":
-        slide_idx = kwargs.get('slide_index', 0)
-        table_idx = kwargs.get('table_index', 0)
-        start_row = kwargs.get('start_row', 0)
-        start_col = kwargs.get('start_col', 0)
-        end_row = kwargs.get('end_row', 0)
-        end_col = kwargs.get('end_col', 0)
-        cell_count = (end_row - start_row + 1) * (end_col - start_col + 1)
-        return f"🎨 Styled table {table_idx} range [{start_row},{start_col}] to [{end_row},{end_col}] on slide {slide_idx + 1} ({cell_count} cells)"
-    
-    elif tool_name == "modify_table_structure":
-        slide_idx = kwargs.get('slide_index', 0)
-        table_idx = kwargs.get('table_index', 0)
-        operation = kwargs.get('operation', '')
-        position = kwargs.get('position', 0)
-        count = kwargs.get('count', 1)
-        operation_desc = operation.replace('_', ' ')
-        count_desc = f" ({count} {'rows' if 'row' in operation else 'columns'})" if count > 1 else ""
-        return f"🔧 Table {table_idx} on slide {slide_idx + 1}: {operation_desc} at position {position}{count_desc}"
-    
-    elif tool_name == "get_table_info":
-        slide_idx = kwargs.get('slide_index', 0)
-        table_idx = kwargs.get('table_index', 0)
-        rows = kwargs.get('rows', 0)
-        cols = kwargs.get('cols', 0)
-        total_cells = kwargs.get('total_cells', 0)
-        return f"ℹ️ Table {table_idx} info on slide {slide_idx + 1}: {rows}×{cols} table with {total_cells} cells"
-    
-    return f"✅ {tool_name} completed successfully"
+    formatter = _SUCCESS_FORMATTERS.get(tool_name)
+    if formatter is None:
+        return f"✅ {tool_name} completed successfully"
+    return formatter(kwargs)
+
+# =============================================================================
+# SHARED HELPERS
+# =============================================================================
+
+# Image sources starting with these are downloaded instead of read from disk
+_URL_PREFIXES = ('http://', 'https://')
+
+# Most blank slides one add_* call may append to reach its slide_index
+_MAX_AUTO_CREATED_SLIDES = 1000
+
+# python-pptx enums for the chart_type and text_alignment tool arguments
+_CHART_TYPE_MAP = {
+    "column": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "bar": XL_CHART_TYPE.BAR_CLUSTERED,
+    "line": XL_CHART_TYPE.LINE,
+    "pie": XL_CHART_TYPE.PIE,
+    "area": XL_CHART_TYPE.AREA
+}
+_ALIGNMENT_MAP = {
+    "left": PP_ALIGN.LEFT,
+    "center": PP_ALIGN.CENTER,
+    "right": PP_ALIGN.RIGHT,
+    "justify": PP_ALIGN.JUSTIFY
+}
+
+def _iter_runs(text_frame):
+    """Yield every run in a text frame, paragraph by paragraph"""
+    for paragraph in text_frame.paragraphs:
+        yield from paragraph.runs
+
+def _mutates_presentation(method):
+    """Mark a manager method as changing the presentation named by its prs_id argument"""
+    @functools.wraps(method)
+    def wrapper(self, prs_id, *args, **kwargs):
+        try:
+            return method(self, prs_id, *args, **kwargs)
+        finally:
+            self._bump_version(prs_id)
+    return wrapper
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a result to indented JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, default=str)
 
 # =============================================================================
 # SIMPLIFIED POWERPOINT MANAGER
@@ -506,21 +601,179 @@ def format_success_message(tool_name: str, **kwargs) -> str:
 class StablePowerPointManager:
     """Simplified PowerPoint manager focused on core functionality"""
     
+    # Named colors accepted by _parse_color
+    COLOR_MAP = {
+        'black': (0, 0, 0),
+        'white': (255, 255, 255),
+        'red': (255, 0, 0),
+        'darkred': (139, 0, 0),
+        'green': (0, 128, 0),
+        'darkgreen': (0, 100, 0),
+        'blue': (0, 0, 255),
+        'darkblue': (0, 0, 139),
+        'yellow': (255, 255, 0),
+        'orange': (255, 165, 0),
+        'purple': (128, 0, 128),
+        'gray': (128, 128, 128),
+        'grey': (128, 128, 128),
+        'lightgray': (211, 211, 211),
+        'lightgrey': (211, 211, 211),
+        'darkgray': (64, 64, 64),
+        'darkgrey': (64, 64, 64)
+    }
+    
+    COLOR_CACHE_MAX_ENTRIES = 256
+    IMAGE_CACHE_MAX_ENTRIES = 128
+    IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    IMAGE_CACHE_DEFAULT_TTL = 60  # seconds a download is reused without revalidating when the server gives no max-age
+    
     def __init__(self):
         self.presentations: Dict[str, Presentation] = {}
-        self.temp_files: List[str] = []  # Track temporary files for cleanup
+        self.temp_files: set = set()  # Track temporary files for cleanup
+        self._id_counter = itertools.count()  # IDs are never reused, even after a presentation is dropped
+        self._layout_cache: Dict[str, List[Dict[str, Any]]] = {}  # Layout listings per presentation
+        self._color_cache: Dict[str, tuple] = {}  # Color string -> parsed RGB tuple
+        self._versions: Dict[str, int] = {}  # Bumped on every change to a presentation
+        self._read_cache: Dict[Tuple, Tuple[int, Any]] = {}  # (kind, prs_id, *args) -> (version, result)
+        self._image_cache: "OrderedDict[str, Tuple[bytes, Dict[str, str], float, float]]" = OrderedDict()  # url -> (data, validators, ttl, fresh until)
+        self._image_cache_bytes = 0
+        self._image_cache_lock = threading.Lock()
+        self._ppt_app = None  # PowerPoint COM application, kept open between screenshots
+        self._ppt_app_started = False  # True if this process launched PowerPoint itself
+        self._com_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ppt-com", initializer=self._init_com_thread
+        )
         logger.info("PowerPoint manager initialized")
     
+    def _bump_version(self, prs_id: str):
+        """Invalidate cached read results for a presentation"""
+        self._versions[prs_id] = self._versions.get(prs_id, 0) + 1
+    
+    def _cached_read(self, kind: str, prs_id: str, compute, *args):
+        """Return compute(prs_id, *args), reusing the last result while the presentation is unchanged"""
+        key = (kind, prs_id) + args
+        version = self._versions.get(prs_id, 0)
+        entry = self._read_cache.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        result = compute(prs_id, *args)
+        self._read_cache[key] = (version, result)
+        return result
+    
+    def _image_ttl(self, headers) -> Optional[float]:
+        """Seconds a downloaded image may be reused without revalidation, or None if it must not be cached"""
+        directives = {}
+        for directive in headers.get("Cache-Control", "").split(","):
+            name, _, value = directive.strip().partition("=")
+            directives[name.lower()] = value.strip('"')
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return 0
+        try:
+            return max(0, int(directives["max-age"]))
+        except (KeyError, ValueError):
+            return self.IMAGE_CACHE_DEFAULT_TTL
+    
+    def _fetch_image(self, url: str) -> io.BytesIO:
+        """Download an image, reusing a fresh cached copy and revalidating a stale one with a conditional GET"""
+        import urllib.error
+        import urllib.request
+        
+        with self._image_cache_lock:
+            cached = self._image_cache.get(url)
+            if cached is not None and time.monotonic() < cached[3]:
+                # Still fresh: no round trip at all
+                self._image_cache.move_to_end(url)
+                return io.BytesIO(cached[0])
+        headers = {}
+        if cached is not None:
+            validators = cached[1]
+            if "ETag" in validators:
+                headers["If-None-Match"] = validators["ETag"]
+            if "Last-Modified" in validators:
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+        
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as response:
+                data = response.read()
+                validators = {
+                    name: response.headers[name]
+                    for name in ("ETag", "Last-Modified") if response.headers.get(name)
+                }
+                ttl = self._image_ttl(response.headers)
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or cached is None:
+                raise
+            # Not modified: keep the cached bytes and restart their freshness window,
+            # under the original caching rules unless the 304 sends new ones
+            ttl = self._image_ttl(e.headers) if e.headers.get("Cache-Control") else cached[2]
+            with self._image_cache_lock:
+                if url in self._image_cache:
+                    if ttl is None:
+                        self._image_cache_bytes -= len(self._image_cache.pop(url)[0])
+                    else:
+                        self._image_cache[url] = (cached[0], cached[1], ttl, time.monotonic() + ttl)
+                        self._image_cache.move_to_end(url)
+            return io.BytesIO(cached[0])
+        
+        # Downloads run in worker threads, so cache updates are serialized
+        with self._image_cache_lock:
+            stale = self._image_cache.pop(url, None)
+            if stale is not None:
+                self._image_cache_bytes -= len(stale[0])
+            # Keep responses that may be reused as-is for a while or revalidated later
+            if ttl is not None and (ttl > 0 or validators) and len(data) <= self.IMAGE_CACHE_MAX_BYTES:
+                self._image_cache[url] = (data, validators, ttl, time.monotonic() + ttl)
+                self._image_cache_bytes += len(data)
+                while (len(self._image_cache) > self.IMAGE_CACHE_MAX_ENTRIES
+                       or self._image_cache_bytes > self.IMAGE_CACHE_MAX_BYTES):
+                    self._image_cache_bytes -= len(self._image_cache.popitem(last=False)[1][0])
+        return io.BytesIO(data)
+    
+    def _get_presentation(self, prs_id: str) -> Presentation:
+        """Look up a loaded presentation, raising ValueError if it is unknown"""
+        prs = self.presentations.get(prs_id)
+        if prs is None:
+            raise ValueError(f"Presentation {prs_id} not found")
+        return prs
+    
+    def _get_or_create_slide(self, prs: Presentation, slide_index: int):
+        """Get a slide by index, appending blank slides until it exists"""
+        slides = prs.slides
+        missing = slide_index + 1 - len(slides)
+        if missing > _MAX_AUTO_CREATED_SLIDES:
+            raise ValueError(
+                f"Slide {slide_index} would require adding {missing} blank slides "
+                f"(presentation has {len(slides)} slides, at most {_MAX_AUTO_CREATED_SLIDES} can be added at once)"
+            )
+        if missing > 0:
+            layout = prs.slide_layouts[6]  # Blank layout
+            for _ in range(missing):
+                slides.add_slide(layout)
+        return slides[slide_index]
+    
     def create_presentation(self) -> str:
         """Create a new blank presentation"""
         prs = Presentation()
-        prs_id = f"ppt_{len(self.presentations)}"
+        prs_id = f"ppt_{next(self._id_counter)}"
         self.presentations[prs_id] = prs
+        self._bump_version(prs_id)
         logger.info(f"Created presentation: {prs_id}")
         return prs_id
     
     def load_presentation(self, file_path: str) -> str:
         """Load an existing PowerPoint presentation from file"""
+        prs, file_path = self._open_presentation(file_path)
+        return self._register_presentation(prs, file_path)
+    
+    async def load_presentation_async(self, file_path: str) -> str:
+        """Async wrapper for load_presentation; only the file parse runs in a worker thread"""
+        prs, file_path = await asyncio.to_thread(self._open_presentation, file_path)
+        return self._register_presentation(prs, file_path)
+    
+    def _open_presentation(self, file_path: str) -> Tuple[Presentation, str]:
+        """Parse a presentation file without touching manager state, returning it with its resolved path"""
         # Ensure .pptx extension if not provided
         if not file_path.lower().endswith('.pptx'):
             file_path += '.pptx'
@@ -529,29 +782,31 @@ class StablePowerPointManager:
         if not os.path.isabs(file_path):
             file_path = os.path.abspath(file_path)
         
-        # Check if file exists
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Presentation file not found: {file_path}")
-        
         try:
-            # Load the presentation
+            # Load the presentation (python-pptx checks the file exists itself)
             prs = Presentation(file_path)
-            prs_id = f"ppt_{len(self.presentations)}"
-            self.presentations[prs_id] = prs
-            
-            logger.info(f"Loaded presentation: {prs_id} from {file_path}")
-            return prs_id
-            
         except Exception as e:
+            # PackageNotFoundError also covers files that exist but are not a valid package
+            if isinstance(e, PackageNotFoundError) and not os.path.exists(file_path):
+                raise FileNotFoundError(f"Presentation file not found: {file_path}") from None
             logger.error(f"Failed to load presentation: {e}")
             raise RuntimeError(f"Failed to load presentation from {file_path}: {e}")
+        
+        return prs, file_path
+    
+    def _register_presentation(self, prs: Presentation, file_path: str) -> str:
+        """Store a loaded presentation under a new ID"""
+        prs_id = f"ppt_{next(self._id_counter)}"
+        self.presentations[prs_id] = prs
+        self._bump_version(prs_id)
+        
+        logger.info(f"Loaded presentation: {prs_id} from {file_path}")
+        return prs_id
     
+    @_mutates_presentation
     def add_slide(self, prs_id: str, layout_index: int = 6) -> int:
         """Add a new slide to the presentation with specified layout"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        prs = self._get_presentation(prs_id)
         
         # Validate layout index
         if layout_index < 0 or layout_index >= len(prs.slide_layouts):
@@ -566,6 +821,7 @@ class StablePowerPointManager:
         logger.info(f"Added slide {slide_index} with layout {layout_index} to {prs_id}")
         return slide_index
     
+    @_mutates_presentation
     def add_text_box(self, prs_id: str, slide_index: int, text: str, 
                      left: float = 1, top: float = 1, width: float = 8, height: float = 1,
                      font_size: int = 18, font_name: str = "Calibri", font_color: Optional[str] = None,
@@ -573,17 +829,10 @@ class StablePowerPointManager:
                      text_alignment: str = "left", fill_color: Optional[str] = None,
                      border_color: Optional[str] = None, border_width: float = 0) -> bool:
         """Add a text box to a slide with comprehensive formatting"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        prs = self._get_presentation(prs_id)
         
         # Add slide if needed
-        while len(prs.slides) <= slide_index:
-            layout = prs.slide_layouts[6]  # Blank layout
-            prs.slides.add_slide(layout)
-        
-        slide = prs.slides[slide_index]
+        slide = self._get_or_create_slide(prs, slide_index)
         
         # Add text box
         textbox = slide.shapes.add_textbox(
@@ -595,32 +844,32 @@ class StablePowerPointManager:
         text_frame.word_wrap = True
         
         # Map text alignment
-        alignment_map = {
-            "left": PP_ALIGN.LEFT,
-            "center": PP_ALIGN.CENTER,
-            "right": PP_ALIGN.RIGHT,
-            "justify": PP_ALIGN.JUSTIFY
-        }
-        paragraph_alignment = alignment_map.get(text_alignment.lower(), PP_ALIGN.LEFT)
+        paragraph_alignment = _ALIGNMENT_MAP.get(text_alignment.lower(), PP_ALIGN.LEFT)
+        
+        # Resolve the values shared by every run once, not per run
+        size = Pt(font_size)
+        color = None
+        if font_color:
+            try:
+                color = RGBColor(*self._parse_color(font_color))
+            except Exception as e:
+                logger.warning(f"Invalid font color '{font_color}': {e}")
         
         # Apply text formatting
         for paragraph in text_frame.paragraphs:
             paragraph.alignment = paragraph_alignment
-            for run in paragraph.runs:
-                # Font properties
-                run.font.name = font_name
-                run.font.size = Pt(font_size)
-                run.font.bold = bold
-                run.font.italic = italic
-                run.font.underline = underline
-                
-                # Font color
-                if font_color:
-                    try:
-                        rgb = self._parse_color(font_color)
-                        run.font.color.rgb = RGBColor(*rgb)
-                    except Exception as e:
-                        logger.warning(f"Invalid font color '{font_color}': {e}")
+        for run in _iter_runs(text_frame):
+            font = run.font
+            # Font properties
+            font.name = font_name
+            font.size = size
+            font.bold = bold
+            font.italic = italic
+            font.underline = underline
+            
+            # Font color
+            if color is not None:
+                font.color.rgb = color
         
         # Apply shape formatting
         try:
@@ -653,6 +902,16 @@ class StablePowerPointManager:
         return True
     
     def _parse_color(self, color_str: str) -> tuple:
+        """Parse color string to RGB tuple, reusing earlier results for the same string"""
+        rgb = self._color_cache.get(color_str)
+        if rgb is None:
+            rgb = self._parse_color_string(color_str)
+            if len(self._color_cache) >= self.COLOR_CACHE_MAX_ENTRIES:
+                self._color_cache.clear()
+            self._color_cache[color_str] = rgb
+        return rgb
+    
+    def _parse_color_string(self, color_str: str) -> tuple:
         """Parse color string to RGB tuple. Supports hex (#RRGGBB) and RGB (r,g,b) formats"""
         color_str = color_str.strip()
         
@@ -662,12 +921,12 @@ class StablePowerPointManager:
         
         if len(color_str) == 6:
             try:
-                r = int(color_str[0:2], 16)
-                g = int(color_str[2:4], 16) 
-                b = int(color_str[4:6], 16)
-                return (r, g, b)
+                rgb = tuple(bytes.fromhex(color_str))
             except ValueError:
-                pass
+                rgb = ()
+            # fromhex skips whitespace, so "ab  cd" decodes to only two bytes
+            if len(rgb) == 3:
+                return rgb
         
         # RGB format: "r,g,b" or "(r,g,b)"
         if ',' in color_str:
@@ -680,90 +939,68 @@ class StablePowerPointManager:
                 pass
         
         # Predefined colors
-        color_map = {
-            'black': (0, 0, 0),
-            'white': (255, 255, 255),
-            'red': (255, 0, 0),
-            'darkred': (139, 0, 0),
-            'green': (0, 128, 0),
-            'darkgreen': (0, 100, 0),
-            'blue': (0, 0, 255),
-            'darkblue': (0, 0, 139),
-            'yellow': (255, 255, 0),
-            'orange': (255, 165, 0),
-            'purple': (128, 0, 128),
-            'gray': (128, 128, 128),
-            'grey': (128, 128, 128),
-            'lightgray': (211, 211, 211),
-            'lightgrey': (211, 211, 211),
-            'darkgray': (64, 64, 64),
-            'darkgrey': (64, 64, 64)
-        }
-        
-        if color_str.lower() in color_map:
-            return color_map[color_str.lower()]
+        rgb = self.COLOR_MAP.get(color_str.lower())
+        if rgb is not None:
+            return rgb
         
         raise ValueError(f"Invalid color format: {color_str}. Use hex (#RRGGBB), RGB (r,g,b), or predefined color names")
     
+    @_mutates_presentation
     def format_existing_text(self, prs_id: str, slide_index: int, shape_index: int,
                            font_size: Optional[int] = None, font_name: Optional[str] = None,
                            font_color: Optional[str] = None, bold: Optional[bool] = None,
                            italic: Optional[bool] = None, underline: Optional[bool] = None,
                            text_alignment: Optional[str] = None) -> bool:
         """Modify formatting of existing text shape"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        prs = self._get_presentation(prs_id)
         
-        if slide_index >= len(prs.slides):
+        try:
+            slide = prs.slides[slide_index]
+        except IndexError:
             raise ValueError(f"Slide {slide_index} does not exist")
         
-        slide = prs.slides[slide_index]
-        
-        if shape_index >= len(slide.shapes):
+        try:
+            shape = slide.shapes[shape_index]
+        except IndexError:
             raise ValueError(f"Shape {shape_index} does not exist")
         
-        shape = slide.shapes[shape_index]
-        
         # Check if it's a text shape
-        if not hasattr(shape, 'text_frame'):
+        if not shape.has_text_frame:
             raise ValueError(f"Shape {shape_index} is not a text shape")
         
         text_frame = shape.text_frame
         
         # Apply text alignment if specified
         if text_alignment:
-            alignment_map = {
-                "left": PP_ALIGN.LEFT,
-                "center": PP_ALIGN.CENTER,
-                "right": PP_ALIGN.RIGHT,
-                "justify": PP_ALIGN.JUSTIFY
-            }
-            paragraph_alignment = alignment_map.get(text_alignment.lower(), PP_ALIGN.LEFT)
+            paragraph_alignment = _ALIGNMENT_MAP.get(text_alignment.lower(), PP_ALIGN.LEFT)
             for paragraph in text_frame.paragraphs:
                 paragraph.alignment = paragraph_alignment
         
+        # Resolve the values shared by every run once, not per run
+        size = Pt(font_size) if font_size is not None else None
+        color = None
+        if font_color:
+            try:
+                color = RGBColor(*self._parse_color(font_color))
+            except Exception as e:
+                logger.warning(f"Invalid font color '{font_color}': {e}")
+        
         # Apply text formatting
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                if font_name is not None:
-                    run.font.name = font_name
-                if font_size is not None:
-                    run.font.size = Pt(font_size)
-                if bold is not None:
-                    run.font.bold = bold
-                if italic is not None:
-                    run.font.italic = italic
-                if underline is not None:
-                    run.font.underline = underline
-                
-                if font_color:
-                    try:
-                        rgb = self._parse_color(font_color)
-                        run.font.color.rgb = RGBColor(*rgb)
-                    except Exception as e:
-                        logger.warning(f"Invalid font color '{font_color}': {e}")
+        for run in _iter_runs(text_frame):
+            font = run.font
+            if font_name is not None:
+                font.name = font_name
+            if size is not None:
+                font.size = size
+            if bold is not None:
+                font.bold = bold
+            if italic is not None:
+                font.italic = italic
+            if underline is not None:
+                font.underline = underline
+            
+            if color is not None:
+                font.color.rgb = color
         
         logger.info(f"Updated formatting for text shape {shape_index} on slide {slide_index}")
         return True
@@ -772,10 +1009,32 @@ class StablePowerPointManager:
                            background_color: Optional[str] = None,
                            background_image: Optional[str] = None) -> bool:
         """Set slide background color or image"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        if background_image and background_image.startswith(_URL_PREFIXES):
+            background_image = self._fetch_background_image(background_image)
+        return self._apply_slide_background(prs_id, slide_index, background_color, background_image)
+    
+    async def set_slide_background_async(self, prs_id: str, slide_index: int,
+                                         background_color: Optional[str] = None,
+                                         background_image: Optional[str] = None) -> bool:
+        """Async wrapper for set_slide_background; only the URL download leaves the event loop"""
+        if background_image and background_image.startswith(_URL_PREFIXES):
+            background_image = await asyncio.to_thread(self._fetch_background_image, background_image)
+        return self._apply_slide_background(prs_id, slide_index, background_color, background_image)
+    
+    def _fetch_background_image(self, url: str) -> io.BytesIO:
+        """Download a background image, wrapping failures like the other background errors"""
+        try:
+            return self._fetch_image(url)
+        except Exception as e:
+            logger.error(f"Failed to set slide background: {e}")
+            raise RuntimeError(f"Failed to set slide background: {e}")
+    
+    @_mutates_presentation
+    def _apply_slide_background(self, prs_id: str, slide_index: int,
+                                background_color: Optional[str],
+                                background_image: Union[str, io.BytesIO, None]) -> bool:
+        """Apply a background color and/or image (local path or downloaded stream) to a slide"""
+        prs = self._get_presentation(prs_id)
         
         if slide_index >= len(prs.slides):
             raise ValueError(f"Slide {slide_index} does not exist")
@@ -794,26 +1053,15 @@ class StablePowerPointManager:
             
             if background_image:
                 # Set background image
-                if background_image.startswith(('http://', 'https://')):
-                    # Download image temporarily
-                    import urllib.request
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-                        urllib.request.urlretrieve(background_image, tmp_file.name)
-                        image_path = tmp_file.name
-                else:
-                    image_path = background_image
-                    if not os.path.exists(image_path):
-                        raise FileNotFoundError(f"Background image not found: {image_path}")
+                image_path = background_image
+                if isinstance(image_path, str) and not os.path.exists(image_path):
+                    raise FileNotFoundError(f"Background image not found: {image_path}")
                 
                 # Apply background image
                 background = slide.background
                 fill = background.fill
                 fill.picture(image_path)
                 
-                # Clean up temporary file if downloaded
-                if background_image.startswith(('http://', 'https://')):
-                    os.unlink(image_path)
-                
                 logger.info(f"Set slide {slide_index} background image")
             
             return True
@@ -826,46 +1074,57 @@ class StablePowerPointManager:
                   left: float = 1, top: float = 1, width: Optional[float] = None, 
                   height: Optional[float] = None) -> bool:
         """Add an image to a slide"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        if image_source.startswith(_URL_PREFIXES):
+            # Download into memory, reusing a cached copy when unchanged
+            image = self._fetch_image_logged(image_source)
+        else:
+            image = image_source
+        return self._add_picture(prs_id, slide_index, image, left, top, width, height)
+    
+    async def add_image_async(self, prs_id: str, slide_index: int, image_source: str,
+                              left: float = 1, top: float = 1, width: Optional[float] = None,
+                              height: Optional[float] = None) -> bool:
+        """Async wrapper for add_image; only the URL download leaves the event loop"""
+        if image_source.startswith(_URL_PREFIXES):
+            image = await asyncio.to_thread(self._fetch_image_logged, image_source)
+        else:
+            image = image_source
+        # The slide and picture are added on the event loop so that concurrent
+        # tool calls never mutate the same presentation from several threads
+        return self._add_picture(prs_id, slide_index, image, left, top, width, height)
+    
+    def _fetch_image_logged(self, url: str) -> io.BytesIO:
+        """Download an image for add_image, logging failures like the other add_image errors"""
+        try:
+            return self._fetch_image(url)
+        except Exception as e:
+            logger.error(f"Failed to add image: {e}")
+            raise
+    
+    @_mutates_presentation
+    def _add_picture(self, prs_id: str, slide_index: int, image: Union[str, io.BytesIO],
+                     left: float, top: float, width: Optional[float],
+                     height: Optional[float]) -> bool:
+        """Place an image (local path or downloaded stream) on a slide"""
+        prs = self._get_presentation(prs_id)
         
         # Add slide if needed
-        while len(prs.slides) <= slide_index:
-            layout = prs.slide_layouts[6]
-            prs.slides.add_slide(layout)
-        
-        slide = prs.slides[slide_index]
+        slide = self._get_or_create_slide(prs, slide_index)
         
         try:
-            # Handle different image sources
-            if image_source.startswith(('http://', 'https://')):
-                # Download image temporarily
-                import urllib.request
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-                    urllib.request.urlretrieve(image_source, tmp_file.name)
-                    image_path = tmp_file.name
-            else:
-                # Local file
-                image_path = image_source
-                if not os.path.exists(image_path):
-                    raise FileNotFoundError(f"Image file not found: {image_path}")
+            if isinstance(image, str) and not os.path.exists(image):
+                raise FileNotFoundError(f"Image file not found: {image}")
             
             # Add image to slide
             if width and height:
                 picture = slide.shapes.add_picture(
-                    image_path, Inches(left), Inches(top), Inches(width), Inches(height)
+                    image, Inches(left), Inches(top), Inches(width), Inches(height)
                 )
             else:
                 picture = slide.shapes.add_picture(
-                    image_path, Inches(left), Inches(top)
+                    image, Inches(left), Inches(top)
                 )
             
-            # Clean up temporary file if downloaded
-            if image_source.startswith(('http://', 'https://')):
-                os.unlink(image_path)
-            
             logger.info(f"Added image to slide {slide_index}")
             return True
             
@@ -873,42 +1132,29 @@ class StablePowerPointManager:
             logger.error(f"Failed to add image: {e}")
             raise
     
+    @_mutates_presentation
     def add_chart(self, prs_id: str, slide_index: int, chart_type: str, 
                   categories: List[str], series_data: Dict[str, List[float]],
                   left: float = 2, top: float = 2, width: float = 6, height: float = 4.5) -> bool:
         """Add a chart to a slide"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        prs = self._get_presentation(prs_id)
         
         # Add slide if needed
-        while len(prs.slides) <= slide_index:
-            layout = prs.slide_layouts[6]
-            prs.slides.add_slide(layout)
-        
-        slide = prs.slides[slide_index]
+        slide = self._get_or_create_slide(prs, slide_index)
         
         try:
             # Create chart data
             chart_data = CategoryChartData()
             chart_data.categories = categories
             
+            category_count = len(categories)
             for series_name, values in series_data.items():
-                if len(values) != len(categories):
-                    raise ValueError(f"Series '{series_name}' has {len(values)} values but {len(categories)} categories")
+                if len(values) != category_count:
+                    raise ValueError(f"Series '{series_name}' has {len(values)} values but {category_count} categories")
                 chart_data.add_series(series_name, values)
             
             # Map chart type
-            chart_type_map = {
-                "column": XL_CHART_TYPE.COLUMN_CLUSTERED,
-                "bar": XL_CHART_TYPE.BAR_CLUSTERED,
-                "line": XL_CHART_TYPE.LINE,
-                "pie": XL_CHART_TYPE.PIE,
-                "area": XL_CHART_TYPE.AREA
-            }
-            
-            xl_chart_type = chart_type_map.get(chart_type, XL_CHART_TYPE.COLUMN_CLUSTERED)
+            xl_chart_type = _CHART_TYPE_MAP.get(chart_type, XL_CHART_TYPE.COLUMN_CLUSTERED)
             
             # Add chart to slide
             chart = slide.shapes.add_chart(
@@ -929,9 +1175,24 @@ class StablePowerPointManager:
     
     def save_presentation(self, prs_id: str, file_path: str) -> str:
         """Save presentation to file and return file info - handles Windows paths properly"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
+        prs = self._get_presentation(prs_id)
+        file_path = self._resolve_save_path(file_path)
+        data = self._serialize_presentation(prs, file_path)
+        self._write_presentation_file(prs_id, file_path, data)
+        return file_path
+    
+    async def save_presentation_async(self, prs_id: str, file_path: str) -> Tuple[str, bytes]:
+        """Async wrapper for save_presentation, returning the saved path and file contents"""
+        prs = self._get_presentation(prs_id)
+        file_path = self._resolve_save_path(file_path)
+        # Serialize on the event loop so no tool call mutates the deck mid-save;
+        # only the disk write runs in a worker thread
+        data = self._serialize_presentation(prs, file_path)
+        await asyncio.to_thread(self._write_presentation_file, prs_id, file_path, data)
+        return file_path, data
+    
+    def _resolve_save_path(self, file_path: str) -> str:
+        """Turn a requested save path into a normalized absolute .pptx path"""
         # Ensure .pptx extension first (before path processing)
         if not file_path.lower().endswith('.pptx'):
             file_path += '.pptx'
@@ -964,8 +1225,20 @@ class StablePowerPointManager:
                 logger.info(f"Fallback to Documents directory: {documents_dir}")
         
         # Normalize path for Windows (handles both / and \ separators)
-        file_path = os.path.normpath(file_path)
-        
+        return os.path.normpath(file_path)
+    
+    def _serialize_presentation(self, prs: Presentation, file_path: str) -> bytes:
+        """Serialize a presentation to .pptx bytes in memory"""
+        try:
+            buffer = io.BytesIO()
+            prs.save(buffer)
+            return buffer.getvalue()
+        except Exception as e:
+            logger.error(f"Save failed: {e}")
+            raise RuntimeError(f"Failed to save PowerPoint file to {file_path}: {e}")
+    
+    def _write_presentation_file(self, prs_id: str, file_path: str, data: bytes):
+        """Write serialized presentation bytes to disk, creating the directory if needed"""
         # Create directory if needed (always try to create parent directory)
         dir_path = os.path.dirname(file_path)
         if dir_path and not os.path.exists(dir_path):
@@ -975,21 +1248,17 @@ class StablePowerPointManager:
             except OSError as e:
                 raise RuntimeError(f"Failed to create directory {dir_path}: {e}")
         
-        # Save presentation
+        # Write the serialized package in one go
         try:
-            self.presentations[prs_id].save(file_path)
+            with open(file_path, 'wb') as f:
+                f.write(data)
             logger.info(f"PowerPoint saved to: {file_path}")
         except Exception as e:
             logger.error(f"Save failed: {e}")
             raise RuntimeError(f"Failed to save PowerPoint file to {file_path}: {e}")
         
-        # Verify the file was created
-        if os.path.exists(file_path):
-            file_size = os.path.getsize(file_path)
-            logger.info(f"Saved {prs_id} to {file_path} ({file_size} bytes)")
-            return file_path
-        else:
-            raise RuntimeError(f"File was not created at {file_path}")
+        # The write succeeded, so the file exists and holds the whole package
+        logger.info(f"Saved {prs_id} to {file_path} ({len(data)} bytes)")
     
     def screenshot_slides(self, file_path: str, output_dir: Optional[str] = None, 
                          image_format: str = "PNG", width: int = 1920, height: int = 1080) -> List[str]:
@@ -1011,16 +1280,56 @@ class StablePowerPointManager:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"PowerPoint file not found: {file_path}")
         
+        # COM objects belong to the thread that created them, so all PowerPoint
+        # automation runs on one dedicated thread that keeps the application open
+        return self._com_executor.submit(
+            self._export_slide_images, file_path, output_dir, image_format, width, height
+        ).result()
+    
+    def _init_com_thread(self):
+        """Initialize COM on the PowerPoint automation thread"""
+        _import_win32com()
+        pythoncom.CoInitialize()
+    
+    def _get_ppt_app(self):
+        """Return the shared PowerPoint application, starting it on first use (COM thread only)"""
+        if self._ppt_app is not None:
+            try:
+                self._ppt_app.Presentations.Count  # Fails if PowerPoint was closed since
+                return self._ppt_app
+            except Exception:
+                self._ppt_app = None
+        
+        # Dispatch attaches to a running PowerPoint, so note whether one was
+        # already open; the user's session must not be quit on shutdown
+        try:
+            win32com.client.GetActiveObject("PowerPoint.Application")
+            self._ppt_app_started = False
+        except pythoncom.com_error:
+            self._ppt_app_started = True
+        
+        ppt_app = win32com.client.Dispatch("PowerPoint.Application")
+        ppt_app.Visible = True  # Make visible for screenshot
+        self._ppt_app = ppt_app
+        return ppt_app
+    
+    def _quit_ppt_app(self):
+        """Close the shared PowerPoint application if this process started it and nothing is open (COM thread only)"""
+        if self._ppt_app is not None:
+            try:
+                if self._ppt_app_started and self._ppt_app.Presentations.Count == 0:
+                    self._ppt_app.Quit()
+            finally:
+                self._ppt_app = None
+                self._ppt_app_started = False
+    
+    def _export_slide_images(self, file_path: str, output_dir: Optional[str],
+                             image_format: str, width: int, height: int) -> List[str]:
+        """Export every slide of a file to images (COM thread only)"""
+        presentation = None
         try:
-            # Initialize COM
-            pythoncom.CoInitialize()
-            
-            # Create PowerPoint application instance
-            ppt_app = win32com.client.Dispatch("PowerPoint.Application")
-            ppt_app.Visible = True  # Make visible for screenshot
-            
             # Open the presentation
-            presentation = ppt_app.Presentations.Open(os.path.abspath(file_path))
+            presentation = self._get_ppt_app().Presentations.Open(os.path.abspath(file_path))
             
             # Set up output directory
             if output_dir is None:
@@ -1029,11 +1338,11 @@ class StablePowerPointManager:
                 os.makedirs(output_dir, exist_ok=True)
             
             screenshot_paths = []
+            extension = image_format.lower()
             
             # Export each slide as image
-            for i, slide in enumerate(presentation.Slides):
-                slide_num = i + 1
-                output_file = os.path.join(output_dir, f"slide_{slide_num:03d}.{image_format.lower()}")
+            for slide_num, slide in enumerate(presentation.Slides, start=1):
+                output_file = os.path.join(output_dir, f"slide_{slide_num:03d}.{extension}")
                 
                 # Export slide as image
                 slide.Export(output_file, image_format, width, height)
@@ -1041,37 +1350,24 @@ class StablePowerPointManager:
                 
                 logger.info(f"Exported slide {slide_num} to {output_file}")
             
-            # Close presentation and quit PowerPoint
-            presentation.Close()
-            ppt_app.Quit()
-            
             # Add to temp files for cleanup if using temp directory
             if output_dir.startswith(tempfile.gettempdir()):
-                self.temp_files.extend(screenshot_paths)
-                self.temp_files.append(output_dir)
+                self.temp_files.update(screenshot_paths)
+                self.temp_files.add(output_dir)
             
             logger.info(f"Successfully created {len(screenshot_paths)} slide screenshots")
             return screenshot_paths
             
         except Exception as e:
             logger.error(f"Error creating slide screenshots: {e}")
-            # Try to cleanup COM objects
-            try:
-                if 'presentation' in locals():
-                    presentation.Close()
-                if 'ppt_app' in locals():
-                    ppt_app.Quit()
-            except:
-                pass
-            finally:
-                pythoncom.CoUninitialize()
             raise
         finally:
-            # Ensure COM is uninitialized
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
+            # Close the file but leave PowerPoint running for the next call
+            if presentation is not None:
+                try:
+                    presentation.Close()
+                except Exception:
+                    pass
     
     async def screenshot_slides_async(self, file_path: str, output_dir: Optional[str] = None, 
                                     image_format: str = "PNG", width: int = 1920, height: int = 1080) -> List[str]:
@@ -1080,6 +1376,13 @@ class StablePowerPointManager:
     
     def cleanup(self):
         """Clean up temporary files and resources"""
+        if self._ppt_app is not None:
+            try:
+                self._com_executor.submit(self._quit_ppt_app).result()
+            except Exception as e:
+                logger.warning(f"Could not close PowerPoint: {e}")
+        self._com_executor.shutdown(wait=False)
+        
         for temp_file in self.temp_files:
             try:
                 if os.path.isfile(temp_file):
@@ -1092,30 +1395,28 @@ class StablePowerPointManager:
         self.temp_files.clear()
         logger.info("Cleanup completed")
     
+    @_mutates_presentation
     def delete_shape(self, prs_id: str, slide_index: int, shape_index: int) -> bool:
         """Delete a specific shape from a slide by index"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        prs = self._get_presentation(prs_id)
         
-        if slide_index >= len(prs.slides):
+        try:
+            slide = prs.slides[slide_index]
+        except IndexError:
             raise ValueError(f"Slide {slide_index} does not exist (presentation has {len(prs.slides)} slides)")
         
-        slide = prs.slides[slide_index]
-        
-        if shape_index >= len(slide.shapes):
-            raise ValueError(f"Shape {shape_index} does not exist (slide has {len(slide.shapes)} shapes)")
-        
         # Get shape info for logging before deletion
-        shape = slide.shapes[shape_index]
+        try:
+            shape = slide.shapes[shape_index]
+        except IndexError:
+            raise ValueError(f"Shape {shape_index} does not exist (slide has {len(slide.shapes)} shapes)")
         shape_type = "unknown"
         try:
-            if hasattr(shape, 'text_frame'):
+            if shape.has_text_frame:
                 shape_type = "text box"
-            elif hasattr(shape, 'chart'):
+            elif shape.has_chart:
                 shape_type = "chart"
-            elif hasattr(shape, 'image'):
+            elif isinstance(shape, Picture):
                 shape_type = "image"
         except:
             pass
@@ -1127,60 +1428,54 @@ class StablePowerPointManager:
         logger.info(f"Deleted {shape_type} (index {shape_index}) from slide {slide_index}")
         return True
     
+    @_mutates_presentation
     def delete_slide(self, prs_id: str, slide_index: int) -> bool:
         """Delete an entire slide from the presentation"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
+        prs = self._get_presentation(prs_id)
         
-        prs = self.presentations[prs_id]
-        
-        if len(prs.slides) <= 1:
+        slide_count = len(prs.slides)
+        if slide_count <= 1:
             raise ValueError("Cannot delete slide - presentation must have at least one slide")
         
-        if slide_index >= len(prs.slides):
-            raise ValueError(f"Slide {slide_index} does not exist (presentation has {len(prs.slides)} slides)")
+        if slide_index >= slide_count:
+            raise ValueError(f"Slide {slide_index} does not exist (presentation has {slide_count} slides)")
         
         # Remove the slide
         xml_slides = prs.slides._sldIdLst
-        slides = list(xml_slides)
-        xml_slides.remove(slides[slide_index])
+        xml_slides.remove(xml_slides[slide_index])
         
         logger.info(f"Deleted slide {slide_index} from presentation {prs_id}")
         return True
     
+    @_mutates_presentation
     def clear_slide(self, prs_id: str, slide_index: int) -> bool:
         """Clear all content from a slide but keep the slide"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        prs = self._get_presentation(prs_id)
         
         if slide_index >= len(prs.slides):
             raise ValueError(f"Slide {slide_index} does not exist (presentation has {len(prs.slides)} slides)")
         
         slide = prs.slides[slide_index]
         
-        # Count shapes before deletion
-        shape_count = len(slide.shapes)
+        # Collect the shape elements in one walk of the shape tree; indexing
+        # slide.shapes[i] per shape re-walks it each time
+        sp_tree = slide.shapes._spTree
+        shape_elements = list(sp_tree.iter_shape_elms())
+        shape_count = len(shape_elements)
         
-        # Delete all shapes (in reverse order to avoid index issues)
-        for i in range(len(slide.shapes) - 1, -1, -1):
-            try:
-                shape = slide.shapes[i]
-                shape_element = shape.element
-                shape_element.getparent().remove(shape_element)
-            except Exception as e:
-                logger.warning(f"Could not delete shape {i}: {e}")
+        for shape_element in shape_elements:
+            sp_tree.remove(shape_element)
         
         logger.info(f"Cleared {shape_count} shapes from slide {slide_index}")
         return True
     
     def list_slide_content(self, prs_id: str, slide_index: int) -> Dict[str, Any]:
-        """List all content on a slide for easier deletion targeting"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        """List all content on a slide for easier deletion targeting (cached until it changes; treat as read-only)"""
+        return self._cached_read("slide_content", prs_id, self._list_slide_content, slide_index)
+    
+    def _list_slide_content(self, prs_id: str, slide_index: int) -> Dict[str, Any]:
+        """Describe each shape on a slide"""
+        prs = self._get_presentation(prs_id)
         
         if slide_index >= len(prs.slides):
             raise ValueError(f"Slide {slide_index} does not exist (presentation has {len(prs.slides)} slides)")
@@ -1196,10 +1491,11 @@ class StablePowerPointManager:
             }
             
             try:
-                if hasattr(shape, 'text_frame') and shape.text_frame.text:
+                text = shape.text_frame.text if shape.has_text_frame else ""
+                if text:
                     shape_info["type"] = "text"
-                    shape_info["description"] = f"Text: '{shape.text_frame.text[:50]}...'" if len(shape.text_frame.text) > 50 else f"Text: '{shape.text_frame.text}'"
-                elif hasattr(shape, 'table'):
+                    shape_info["description"] = f"Text: '{text[:50]}...'" if len(text) > 50 else f"Text: '{text}'"
+                elif shape.has_table:
                     shape_info["type"] = "table"
                     table = shape.table
                     rows = len(table.rows)
@@ -1211,10 +1507,10 @@ class StablePowerPointManager:
                         shape_info["description"] = f"Table ({rows}×{cols}) - {preview}"
                     except:
                         shape_info["description"] = f"Table ({rows}×{cols})"
-                elif hasattr(shape, 'chart'):
+                elif shape.has_chart:
                     shape_info["type"] = "chart"
                     shape_info["description"] = "Chart"
-                elif hasattr(shape, 'image'):
+                elif isinstance(shape, Picture):
                     shape_info["type"] = "image"
                     shape_info["description"] = "Image"
                 else:
@@ -1231,13 +1527,9 @@ class StablePowerPointManager:
             "shapes": content
         }
     
-    def extract_text(self, prs_id: str) -> List[Dict[str, Any]]:
-        """Extract all text content from the presentation"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
-        extracted_text = []
+    def iter_slide_text(self, prs_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield the text content of each slide in turn"""
+        prs = self._get_presentation(prs_id)
         
         for slide_idx, slide in enumerate(prs.slides):
             slide_text = {
@@ -1248,14 +1540,16 @@ class StablePowerPointManager:
             
             for shape_idx, shape in enumerate(slide.shapes):
                 try:
-                    if hasattr(shape, 'text_frame') and shape.text_frame.text.strip():
+                    # Read the frame text once; each .text access re-walks the paragraphs
+                    text = shape.text_frame.text.strip() if shape.has_text_frame else ""
+                    if text:
                         shape_text = {
                             "shape_index": shape_idx,
                             "shape_type": "text",
-                            "text": shape.text_frame.text.strip()
+                            "text": text
                         }
                         slide_text["text_content"].append(shape_text)
-                    elif hasattr(shape, 'table'):
+                    elif shape.has_table:
                         # Extract text from table cells using enhanced method
                         table_text = self._extract_table_text(shape.table, shape_idx)
                         if table_text:
@@ -1263,17 +1557,25 @@ class StablePowerPointManager:
                 except Exception as e:
                     logger.warning(f"Could not extract text from shape {shape_idx} on slide {slide_idx}: {e}")
             
-            extracted_text.append(slide_text)
-        
+            yield slide_text
+    
+    def extract_text(self, prs_id: str) -> List[Dict[str, Any]]:
+        """Extract all text content from the presentation (cached until it changes; treat as read-only)"""
+        return self._cached_read("extract_text", prs_id, self._extract_text)
+    
+    def _extract_text(self, prs_id: str) -> List[Dict[str, Any]]:
+        """Walk every slide and collect its text content"""
+        extracted_text = list(self.iter_slide_text(prs_id))
         logger.info(f"Extracted text from {len(extracted_text)} slides in {prs_id}")
         return extracted_text
-
+    
     def get_presentation_info(self, prs_id: str) -> Dict[str, Any]:
-        """Get comprehensive presentation information"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        """Get comprehensive presentation information (cached until it changes; treat as read-only)"""
+        return self._cached_read("presentation_info", prs_id, self._get_presentation_info)
+    
+    def _get_presentation_info(self, prs_id: str) -> Dict[str, Any]:
+        """Count shapes by type across all slides"""
+        prs = self._get_presentation(prs_id)
         
         # Count different types of content
         total_text_boxes = 0
@@ -1295,13 +1597,13 @@ class StablePowerPointManager:
             for shape in slide.shapes:
                 total_shapes += 1
                 try:
-                    if hasattr(shape, 'text_frame') and shape.text_frame.text.strip():
+                    if shape.has_text_frame and shape.text_frame.text.strip():
                         total_text_boxes += 1
                         slide_info["has_text"] = True
-                    elif hasattr(shape, 'chart'):
+                    elif shape.has_chart:
                         total_charts += 1
                         slide_info["has_charts"] = True
-                    elif hasattr(shape, 'image'):
+                    elif isinstance(shape, Picture):
                         total_images += 1
                         slide_info["has_images"] = True
                 except:
@@ -1310,19 +1612,7 @@ class StablePowerPointManager:
             slide_details.append(slide_info)
         
         # Get available slide layouts
-        available_layouts = []
-        for i, layout in enumerate(prs.slide_layouts):
-            try:
-                layout_name = layout.name if hasattr(layout, 'name') else f"Layout {i}"
-                available_layouts.append({
-                    "index": i,
-                    "name": layout_name
-                })
-            except:
-                available_layouts.append({
-                    "index": i,
-                    "name": f"Layout {i}"
-                })
+        available_layouts = self._get_available_layouts(prs_id)
         
         return {
             "presentation_id": prs_id,
@@ -1339,6 +1629,30 @@ class StablePowerPointManager:
             "status": "ready"
         }
     
+    def _get_available_layouts(self, prs_id: str) -> List[Dict[str, Any]]:
+        """Get the slide layout listing for a presentation (cached - layouts never change at runtime)"""
+        available_layouts = self._layout_cache.get(prs_id)
+        if available_layouts is not None:
+            return available_layouts
+        
+        prs = self.presentations[prs_id]
+        available_layouts = []
+        for i, layout in enumerate(prs.slide_layouts):
+            try:
+                layout_name = layout.name if hasattr(layout, 'name') else f"Layout {i}"
+                available_layouts.append({
+                    "index": i,
+                    "name": layout_name
+                })
+            except:
+                available_layouts.append({
+                    "index": i,
+                    "name": f"Layout {i}"
+                })
+        
+        self._layout_cache[prs_id] = available_layouts
+        return available_layouts
+    
     def _post_process_slide(self, prs_id: str, slide_index: int):
         """Basic post-processing to fix common issues"""
         try:
@@ -1347,7 +1661,7 @@ class StablePowerPointManager:
             
             # Fix green rectangle fills on placeholder shapes
             for shape in slide.shapes:
-                if hasattr(shape, 'fill'):
+                if isinstance(shape, AutoShape):
                     try:
                         if hasattr(shape.fill, 'solid'):
                             shape.fill.solid()
@@ -1364,15 +1678,12 @@ class StablePowerPointManager:
     
     def _get_table_shape(self, prs_id: str, slide_index: int, table_index: int):
         """Get table shape object with validation"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        prs = self._get_presentation(prs_id)
         if slide_index >= len(prs.slides):
             raise ValueError(f"Slide {slide_index} does not exist")
         
         slide = prs.slides[slide_index]
-        tables = [shape for shape in slide.shapes if hasattr(shape, 'table')]
+        tables = [shape for shape in slide.shapes if shape.has_table]
         
         if table_index >= len(tables):
             raise ValueError(f"Table {table_index} does not exist (found {len(tables)} tables)")
@@ -1383,21 +1694,15 @@ class StablePowerPointManager:
         """Get table object with validation"""
         return self._get_table_shape(prs_id, slide_index, table_index).table
     
+    @_mutates_presentation
     def add_table(self, prs_id: str, slide_index: int, rows: int, cols: int,
                   left: float = 1, top: float = 1, width: float = 8, height: float = 4,
                   header_row: bool = False) -> int:
         """Add a table to a slide and return table index"""
-        if prs_id not in self.presentations:
-            raise ValueError(f"Presentation {prs_id} not found")
-        
-        prs = self.presentations[prs_id]
+        prs = self._get_presentation(prs_id)
         
         # Add slide if needed
-        while len(prs.slides) <= slide_index:
-            layout = prs.slide_layouts[6]
-            prs.slides.add_slide(layout)
-        
-        slide = prs.slides[slide_index]
+        slide = self._get_or_create_slide(prs, slide_index)
         
         try:
             # Add table
@@ -1412,22 +1717,20 @@ class StablePowerPointManager:
                 for col_idx in range(cols):
                     cell = table.cell(0, col_idx)
                     # Make header bold
-                    for paragraph in cell.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.bold = True
+                    for run in _iter_runs(cell.text_frame):
+                        run.font.bold = True
                     # Add header background - blue header
                     try:
                         cell.fill.solid()
                         cell.fill.fore_color.rgb = RGBColor(79, 129, 189)  # Blue header
                         # Set text color to white for contrast
-                        for paragraph in cell.text_frame.paragraphs:
-                            for run in paragraph.runs:
-                                run.font.color.rgb = RGBColor(255, 255, 255)  # White text
+                        for run in _iter_runs(cell.text_frame):
+                            run.font.color.rgb = RGBColor(255, 255, 255)  # White text
                     except Exception as e:
                         logger.warning(f"Failed to style header row: {e}")
             
             # Return the index of the newly created table
-            table_index = len([shape for shape in slide.shapes if hasattr(shape, 'table')]) - 1
+            table_index = len([shape for shape in slide.shapes if shape.has_table]) - 1
             
             logger.info(f"Added {rows}×{cols} table to slide {slide_index}")
             return table_index
@@ -1436,6 +1739,7 @@ class StablePowerPointManager:
             logger.error(f"Failed to add table: {e}")
             raise RuntimeError(f"Failed to add table to slide {slide_index}: {e}")
     
+    @_mutates_presentation
     def set_table_cell(self, prs_id: str, slide_index: int, table_index: int,
                        row: int, col: int, text: str,
                        font_size: Optional[int] = None, font_name: Optional[str] = None,
@@ -1449,6 +1753,17 @@ class StablePowerPointManager:
         if row >= len(table.rows) or col >= len(table.columns):
             raise ValueError(f"Cell [{row},{col}] is out of bounds for table with {len(table.rows)} rows and {len(table.columns)} columns")
         
+        return self._write_table_cell(
+            table, table_index, row, col, text,
+            font_size, font_name, font_color, bold, italic, underline, text_alignment
+        )
+    
+    def _write_table_cell(self, table, table_index: int, row: int, col: int, text: str,
+                          font_size: Optional[int] = None, font_name: Optional[str] = None,
+                          font_color: Optional[str] = None, bold: Optional[bool] = None,
+                          italic: Optional[bool] = None, underline: Optional[bool] = None,
+                          text_alignment: Optional[str] = None) -> bool:
+        """Set content and formatting of a cell in an already resolved table"""
         try:
             cell = table.cell(row, col)
             cell.text = text
@@ -1459,34 +1774,34 @@ class StablePowerPointManager:
                 
                 # Map text alignment
                 if text_alignment:
-                    alignment_map = {
-                        "left": PP_ALIGN.LEFT,
-                        "center": PP_ALIGN.CENTER,
-                        "right": PP_ALIGN.RIGHT,
-                        "justify": PP_ALIGN.JUSTIFY
-                    }
-                    paragraph_alignment = alignment_map.get(text_alignment.lower(), PP_ALIGN.LEFT)
+                    paragraph_alignment = _ALIGNMENT_MAP.get(text_alignment.lower(), PP_ALIGN.LEFT)
                     for paragraph in text_frame.paragraphs:
                         paragraph.alignment = paragraph_alignment
                 
+                # Resolve the values shared by every run once, not per run; the color
+                # is parsed on the first run so a cell without text never rejects it
+                size = Pt(font_size) if font_size else None
+                color = None
+                
                 # Apply formatting to all runs
-                for paragraph in text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        if font_name:
-                            run.font.name = font_name
-                        if font_size:
-                            run.font.size = Pt(font_size)
-                        if bold is not None:
-                            run.font.bold = bold
-                        if italic is not None:
-                            run.font.italic = italic
-                        if underline is not None:
-                            run.font.underline = underline
-                        if font_color:
-                            rgb = self._parse_color(font_color)
-                            run.font.color.rgb = RGBColor(*rgb)
-            
-            logger.info(f"Set table cell [{row},{col}] content and formatting")
+                for run in _iter_runs(text_frame):
+                    font = run.font
+                    if font_name:
+                        font.name = font_name
+                    if size is not None:
+                        font.size = size
+                    if bold is not None:
+                        font.bold = bold
+                    if italic is not None:
+                        font.italic = italic
+                    if underline is not None:
+                        font.underline = underline
+                    if font_color:
+                        if color is None:
+                            color = RGBColor(*self._parse_color(font_color))
+                        font.color.rgb = color
+            
+            logger.info("Set table cell [%s,%s] content and formatting", row, col)
             return True
             
         except Exception as e:
@@ -1499,23 +1814,22 @@ class StablePowerPointManager:
         
         try:
             # Extract cell contents
-            cell_data = []
-            for row_idx, row in enumerate(table.rows):
-                row_data = []
-                for col_idx, cell in enumerate(row.cells):
-                    row_data.append({
-                        "text": cell.text.strip(),
-                        "row": row_idx,
-                        "col": col_idx
-                    })
-                cell_data.append(row_data)
+            cell_data = [
+                [
+                    {"text": cell.text.strip(), "row": row_idx, "col": col_idx}
+                    for col_idx, cell in enumerate(row.cells)
+                ]
+                for row_idx, row in enumerate(table.rows)
+            ]
+            row_count = len(cell_data)
+            col_count = len(table.columns)
             
             return {
                 "table_index": table_index,
-                "rows": len(table.rows),
-                "columns": len(table.columns),
+                "rows": row_count,
+                "columns": col_count,
                 "cell_data": cell_data,
-                "total_cells": len(table.rows) * len(table.columns)
+                "total_cells": row_count * col_count
             }
             
         except Exception as e:
@@ -1525,12 +1839,10 @@ class StablePowerPointManager:
     def _extract_table_text(self, table, shape_idx):
         """Extract text content from table cells for enhanced text extraction"""
         try:
+            rows = table.rows
             table_content = []
-            for row_idx, row in enumerate(table.rows):
-                row_content = []
-                for col_idx, cell in enumerate(row.cells):
-                    if cell.text.strip():
-                        row_content.append(cell.text.strip())
+            for row in rows:
+                row_content = [text for text in (cell.text.strip() for cell in row.cells) if text]
                 if row_content:
                     table_content.append(" | ".join(row_content))
             
@@ -1539,7 +1851,7 @@ class StablePowerPointManager:
                     "shape_index": shape_idx,
                     "shape_type": "table",
                     "text": "\n".join(table_content),
-                    "rows": len(table.rows),
+                    "rows": len(rows),
                     "columns": len(table.columns)
                 }
             return None
@@ -1551,6 +1863,7 @@ class StablePowerPointManager:
     # TABLE OPERATIONS - Phase 2: Advanced Styling
     # =============================================================================
     
+    @_mutates_presentation
     def style_table_cell(self, prs_id: str, slide_index: int, table_index: int,
                          row: int, col: int, fill_color: Optional[str] = None,
                          border_color: Optional[str] = None, border_width: Optional[float] = None,
@@ -1563,6 +1876,28 @@ class StablePowerPointManager:
         if row >= len(table.rows) or col >= len(table.columns):
             raise ValueError(f"Cell [{row},{col}] is out of bounds for table with {len(table.rows)} rows and {len(table.columns)} columns")
         
+        return self._style_table_cell(
+            table, table_index, row, col, fill_color, border_color, border_width,
+            self._cell_margins(margin_left, margin_right, margin_top, margin_bottom)
+        )
+    
+    @staticmethod
+    def _cell_margins(margin_left: Optional[float] = None, margin_right: Optional[float] = None,
+                      margin_top: Optional[float] = None, margin_bottom: Optional[float] = None) -> Dict[str, Length]:
+        """Convert the requested cell margins from inches to EMU lengths, keyed by cell attribute"""
+        margins = {
+            "margin_left": margin_left,
+            "margin_right": margin_right,
+            "margin_top": margin_top,
+            "margin_bottom": margin_bottom,
+        }
+        return {attr: Inches(value) for attr, value in margins.items() if value is not None}
+    
+    def _style_table_cell(self, table, table_index: int, row: int, col: int,
+                          fill_color: Optional[str] = None,
+                          border_color: Optional[str] = None, border_width: Optional[float] = None,
+                          margins: Optional[Dict[str, Length]] = None) -> bool:
+        """Style a cell in an already resolved table (margins come from _cell_margins)"""
         try:
             cell = table.cell(row, col)
             
@@ -1571,25 +1906,13 @@ class StablePowerPointManager:
                 rgb = self._parse_color(fill_color)
                 cell.fill.solid()
                 cell.fill.fore_color.rgb = RGBColor(*rgb)
-                logger.info(f"Applied fill color {fill_color} to cell [{row},{col}]")
+                logger.info("Applied fill color %s to cell [%s,%s]", fill_color, row, col)
             
             # Apply margins
-            margin_applied = False
-            if margin_left is not None:
-                cell.margin_left = Inches(margin_left)
-                margin_applied = True
-            if margin_right is not None:
-                cell.margin_right = Inches(margin_right)
-                margin_applied = True
-            if margin_top is not None:
-                cell.margin_top = Inches(margin_top)
-                margin_applied = True
-            if margin_bottom is not None:
-                cell.margin_bottom = Inches(margin_bottom)
-                margin_applied = True
-            
-            if margin_applied:
-                logger.info(f"Applied margins to cell [{row},{col}]")
+            if margins:
+                for attr, length in margins.items():
+                    setattr(cell, attr, length)
+                logger.info("Applied margins to cell [%s,%s]", row, col)
             
             # Apply borders (simplified approach - python-pptx has limited border support)
             if border_color and border_width:
@@ -1598,17 +1921,18 @@ class StablePowerPointManager:
                     # This is a simplified implementation that may not work perfectly
                     rgb = self._parse_color(border_color)
                     # Set border on the cell (this may not work as expected due to python-pptx limitations)
-                    logger.info(f"Attempted to apply border to cell [{row},{col}] - limited support in python-pptx")
+                    logger.info("Attempted to apply border to cell [%s,%s] - limited support in python-pptx", row, col)
                 except Exception as e:
                     logger.warning(f"Border styling not fully supported: {e}")
             
-            logger.info(f"Applied styling to table cell [{row},{col}]")
+            logger.info("Applied styling to table cell [%s,%s]", row, col)
             return True
             
         except Exception as e:
             logger.error(f"Failed to style table cell: {e}")
             raise RuntimeError(f"Failed to style cell [{row},{col}] in table {table_index}: {e}")
     
+    @_mutates_presentation
     def style_table_range(self, prs_id: str, slide_index: int, table_index: int,
                          start_row: int, start_col: int, end_row: int, end_col: int,
                          fill_color: Optional[str] = None, border_color: Optional[str] = None,
@@ -1625,14 +1949,16 @@ class StablePowerPointManager:
         if end_row >= len(table.rows) or end_col >= len(table.columns):
             raise ValueError(f"Range end [{end_row},{end_col}] is out of bounds for table with {len(table.rows)} rows and {len(table.columns)} columns")
         
+        # Convert margins once for the whole range rather than per cell
+        margins = self._cell_margins(margin_left, margin_right, margin_top, margin_bottom)
+        
         try:
             cells_styled = 0
             for row in range(start_row, end_row + 1):
                 for col in range(start_col, end_col + 1):
-                    self.style_table_cell(
-                        prs_id, slide_index, table_index, row, col,
-                        fill_color, border_color, border_width,
-                        margin_left, margin_right, margin_top, margin_bottom
+                    self._style_table_cell(
+                        table, table_index, row, col,
+                        fill_color, border_color, border_width, margins
                     )
                     cells_styled += 1
             
@@ -1643,6 +1969,7 @@ class StablePowerPointManager:
             logger.error(f"Failed to style table range: {e}")
             raise RuntimeError(f"Failed to style range [{start_row},{start_col}] to [{end_row},{end_col}] in table {table_index}: {e}")
     
+    @_mutates_presentation
     def create_table_with_data(self, prs_id: str, slide_index: int, 
                               table_data: List[List[str]], headers: Optional[List[str]] = None,
                               left: float = 1, top: float = 1, width: float = 8, height: float = 4,
@@ -1669,13 +1996,15 @@ class StablePowerPointManager:
         )
         
         try:
+            # Resolve the new table once and fill its cells directly
+            table = self._get_table(prs_id, slide_index, table_index)
             current_row = 0
             
             # Set headers if provided
             if headers:
                 for col_idx, header_text in enumerate(headers):
-                    self.set_table_cell(
-                        prs_id, slide_index, table_index, current_row, col_idx, header_text,
+                    self._write_table_cell(
+                        table, table_index, current_row, col_idx, header_text,
                         **(header_style or {})
                     )
                 current_row += 1
@@ -1693,13 +2022,13 @@ class StablePowerPointManager:
                     if alternating_rows and current_row % 2 == 1:
                         # Odd rows get light gray background
                         if 'fill_color' not in cell_style:
-                            self.style_table_cell(
-                                prs_id, slide_index, table_index, current_row, col_idx,
+                            self._style_table_cell(
+                                table, table_index, current_row, col_idx,
                                 fill_color="#F2F2F2"
                             )
                     
-                    self.set_table_cell(
-                        prs_id, slide_index, table_index, current_row, col_idx, str(cell_text),
+                    self._write_table_cell(
+                        table, table_index, current_row, col_idx, str(cell_text),
                         **cell_style
                     )
                 
@@ -1712,6 +2041,7 @@ class StablePowerPointManager:
             logger.error(f"Failed to create table with data: {e}")
             raise RuntimeError(f"Failed to populate table with data: {e}")
     
+    @_mutates_presentation
     def modify_table_structure(self, prs_id: str, slide_index: int, table_index: int,
                                operation: str, position: Optional[int] = None, count: int = 1) -> bool:
         """
@@ -1782,13 +2112,7 @@ class StablePowerPointManager:
                 raise ValueError(f"Unknown operation: {operation}")
             
             # Extract all current cell data
-            cell_data = []
-            for row_idx in range(current_rows):
-                row_data = []
-                for col_idx in range(current_cols):
-                    cell = table.cell(row_idx, col_idx)
-                    row_data.append(cell.text)
-                cell_data.append(row_data)
+            cell_data = [[cell.text for cell in row.cells] for row in table.rows]
             
             # Get table position and size
             left = table_shape.left
@@ -1801,18 +2125,8 @@ class StablePowerPointManager:
             slide = prs.slides[slide_index]
             
             # Remove the old table
-            shape_to_remove = None
-            for shape in slide.shapes:
-                if hasattr(shape, 'table') and shape.table == table:
-                    shape_to_remove = shape
-                    break
-            
-            if shape_to_remove:
-                slide_shapes = slide.shapes._spTree
-                for shape_elem in slide_shapes:
-                    if hasattr(shape_elem, 'get') and shape_elem.get('id') == str(shape_to_remove.shape_id):
-                        slide_shapes.remove(shape_elem)
-                        break
+            table_element = table_shape.element
+            table_element.getparent().remove(table_element)
             
             # Create new table with modified dimensions
             new_table_shape = slide.shapes.add_table(new_rows, new_cols, left, top, width, height)
@@ -1874,11 +2188,12 @@ class StablePowerPointManager:
                             old_col = new_col + count
                     
                     # Copy text if valid coordinates
-                    if old_row >= 0 and old_col >= 0 and old_row < len(cell_data) and old_col < len(cell_data[0]):
+                    if 0 <= old_row < current_rows and 0 <= old_col < current_cols:
                         text = cell_data[old_row][old_col]
                     
-                    # Set cell content
-                    new_table.cell(new_row, new_col).text = text
+                    # Set cell content (new cells are already empty, so skip the XML rewrite)
+                    if text:
+                        new_table.cell(new_row, new_col).text = text
             
             logger.info(f"Successfully modified table structure: {operation} (count: {count}, position: {position})")
             logger.info(f"Table dimensions changed from {current_rows}×{current_cols} to {new_rows}×{new_cols}")
@@ -1910,16 +2225,20 @@ class StablePowerPointManager:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Presentation file not found: {file_path}")
         
-        # Load presentation for analysis
-        temp_prs_id = self.load_presentation(file_path)
-        prs = self.presentations[temp_prs_id]
+        # Parse the file for analysis only; it is never registered with the
+        # manager, so this worker thread leaves the shared caches untouched
+        prs, _ = self._open_presentation(file_path)
+        
+        # Materialize every slide's shapes once; the analyzers below all walk
+        # the same shapes and building the shape proxies dominates their cost
+        slide_shapes = [list(slide.shapes) for slide in prs.slides]
         
         critique_results = {
             "file_path": file_path,
             "critique_type": critique_type,
             "timestamp": datetime.now().isoformat(),
             "summary": {
-                "total_slides": len(prs.slides),
+                "total_slides": len(slide_shapes),
                 "overall_score": 0,
                 "critical_issues": 0,
                 "warnings": 0,
@@ -1931,58 +2250,52 @@ class StablePowerPointManager:
             "detailed_analysis": {}
         }
         
-        try:
-            # Generate screenshots if requested
-            screenshot_paths = []
-            if include_screenshots:
-                try:
-                    screenshot_paths = self.screenshot_slides(
-                        file_path, output_dir, "PNG", 1920, 1080
-                    )
-                    critique_results["screenshots"] = screenshot_paths
-                except Exception as e:
-                    logger.warning(f"Could not generate screenshots: {e}")
-            
-            # Perform analysis based on critique type
-            if critique_type in ["design", "comprehensive"]:
-                design_analysis = self._analyze_design_quality(prs, screenshot_paths)
-                critique_results["detailed_analysis"]["design"] = design_analysis
-                critique_results["issues"].extend(design_analysis.get("issues", []))
-                critique_results["strengths"].extend(design_analysis.get("strengths", []))
-                critique_results["recommendations"].extend(design_analysis.get("recommendations", []))
-            
-            if critique_type in ["content", "comprehensive"]:
-                content_analysis = self._analyze_content_quality(prs)
-                critique_results["detailed_analysis"]["content"] = content_analysis
-                critique_results["issues"].extend(content_analysis.get("issues", []))
-                critique_results["strengths"].extend(content_analysis.get("strengths", []))
-                critique_results["recommendations"].extend(content_analysis.get("recommendations", []))
-            
-            if critique_type in ["accessibility", "comprehensive"]:
-                accessibility_analysis = self._analyze_accessibility(prs)
-                critique_results["detailed_analysis"]["accessibility"] = accessibility_analysis
-                critique_results["issues"].extend(accessibility_analysis.get("issues", []))
-                critique_results["strengths"].extend(accessibility_analysis.get("strengths", []))
-                critique_results["recommendations"].extend(accessibility_analysis.get("recommendations", []))
-            
-            if critique_type in ["technical", "comprehensive"]:
-                technical_analysis = self._analyze_technical_quality(file_path, prs)
-                critique_results["detailed_analysis"]["technical"] = technical_analysis
-                critique_results["issues"].extend(technical_analysis.get("issues", []))
-                critique_results["strengths"].extend(technical_analysis.get("strengths", []))
-                critique_results["recommendations"].extend(technical_analysis.get("recommendations", []))
-            
-            # Calculate summary metrics
-            critique_results = self._calculate_critique_summary(critique_results)
-            
-            return critique_results
-            
-        finally:
-            # Clean up temporary presentation
-            if temp_prs_id in self.presentations:
-                del self.presentations[temp_prs_id]
+        # Generate screenshots if requested
+        screenshot_paths = []
+        if include_screenshots:
+            try:
+                screenshot_paths = self.screenshot_slides(
+                    file_path, output_dir, "PNG", 1920, 1080
+                )
+                critique_results["screenshots"] = screenshot_paths
+            except Exception as e:
+                logger.warning(f"Could not generate screenshots: {e}")
+        
+        # Perform analysis based on critique type
+        if critique_type in ["design", "comprehensive"]:
+            design_analysis = self._analyze_design_quality(slide_shapes, screenshot_paths)
+            critique_results["detailed_analysis"]["design"] = design_analysis
+            critique_results["issues"].extend(design_analysis.get("issues", []))
+            critique_results["strengths"].extend(design_analysis.get("strengths", []))
+            critique_results["recommendations"].extend(design_analysis.get("recommendations", []))
+        
+        if critique_type in ["content", "comprehensive"]:
+            content_analysis = self._analyze_content_quality(slide_shapes)
+            critique_results["detailed_analysis"]["content"] = content_analysis
+            critique_results["issues"].extend(content_analysis.get("issues", []))
+            critique_results["strengths"].extend(content_analysis.get("strengths", []))
+            critique_results["recommendations"].extend(content_analysis.get("recommendations", []))
+        
+        if critique_type in ["accessibility", "comprehensive"]:
+            accessibility_analysis = self._analyze_accessibility(slide_shapes)
+            critique_results["detailed_analysis"]["accessibility"] = accessibility_analysis
+            critique_results["issues"].extend(accessibility_analysis.get("issues", []))
+            critique_results["strengths"].extend(accessibility_analysis.get("strengths", []))
+            critique_results["recommendations"].extend(accessibility_analysis.get("recommendations", []))
+        
+        if critique_type in ["technical", "comprehensive"]:
+            technical_analysis = self._analyze_technical_quality(file_path, slide_shapes)
+            critique_results["detailed_analysis"]["technical"] = technical_analysis
+            critique_results["issues"].extend(technical_analysis.get("issues", []))
+            critique_results["strengths"].extend(technical_analysis.get("strengths", []))
+            critique_results["recommendations"].extend(technical_analysis.get("recommendations", []))
+        
+        # Calculate summary metrics
+        critique_results = self._calculate_critique_summary(critique_results)
+        
+        return critique_results
 
-    def _analyze_design_quality(self, prs, screenshot_paths: List[str] = None) -> Dict[str, Any]:
+    def _analyze_design_quality(self, slide_shapes: List[List[Any]], screenshot_paths: List[str] = None) -> Dict[str, Any]:
         """Analyze design quality aspects of the presentation"""
         analysis = {
             "score": 0,
@@ -1998,25 +2311,27 @@ class StablePowerPointManager:
         slide_layouts = []
         color_usage = {}
         
-        for slide_idx, slide in enumerate(prs.slides):
+        for slide_idx, shapes in enumerate(slide_shapes):
             slide_fonts = set()
             slide_font_sizes = []
             
             # Analyze shapes and text
-            for shape in slide.shapes:
-                if hasattr(shape, 'text_frame') and shape.text_frame:
-                    for paragraph in shape.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            if run.font.name:
-                                fonts_used.add(run.font.name)
-                                slide_fonts.add(run.font.name)
-                            if run.font.size:
-                                font_size = run.font.size.pt
-                                font_sizes.append(font_size)
-                                slide_font_sizes.append(font_size)
+            for shape in shapes:
+                if shape.has_text_frame:
+                    for run in _iter_runs(shape.text_frame):
+                        font = run.font
+                        font_name = font.name
+                        if font_name:
+                            fonts_used.add(font_name)
+                            slide_fonts.add(font_name)
+                        size = font.size
+                        if size:
+                            font_size = size.pt
+                            font_sizes.append(font_size)
+                            slide_font_sizes.append(font_size)
                 
                 # Check for visual issues
-                if hasattr(shape, 'fill') and shape.fill.type is not None:
+                if isinstance(shape, AutoShape) and shape.fill.type is not None:
                     # Check for problematic green rectangles
                     try:
                         if hasattr(shape.fill, 'fore_color'):
@@ -2099,7 +2414,7 @@ class StablePowerPointManager:
         
         return analysis
 
-    def _analyze_content_quality(self, prs) -> Dict[str, Any]:
+    def _analyze_content_quality(self, slide_shapes: List[List[Any]]) -> Dict[str, Any]:
         """Analyze content quality and structure"""
         analysis = {
             "score": 0,
@@ -2109,35 +2424,37 @@ class StablePowerPointManager:
             "metrics": {}
         }
         
+        slide_count = len(slide_shapes)
         total_text_length = 0
         slides_with_title = 0
         slides_with_bullets = 0
         bullet_counts = []
         empty_slides = 0
         
-        for slide_idx, slide in enumerate(prs.slides):
+        for slide_idx, shapes in enumerate(slide_shapes):
             slide_text_length = 0
             has_title = False
             bullet_count = 0
             has_content = False
             
-            for shape in slide.shapes:
-                if hasattr(shape, 'text_frame') and shape.text_frame:
-                    shape_text = shape.text_frame.text.strip()
+            for shape in shapes:
+                if shape.has_text_frame:
+                    text_frame = shape.text_frame
+                    shape_text = text_frame.text.strip()
                     if shape_text:
                         has_content = True
                         slide_text_length += len(shape_text)
                         
                         # Check if this is likely a title (large font, short text)
                         if len(shape_text) < 100 and not has_title:
-                            for paragraph in shape.text_frame.paragraphs:
-                                for run in paragraph.runs:
-                                    if run.font.size and run.font.size.pt > 24:
-                                        has_title = True
-                                        break
+                            for run in _iter_runs(text_frame):
+                                size = run.font.size
+                                if size and size.pt > 24:
+                                    has_title = True
+                                    break
                         
-                        # Count bullet points
-                        bullet_count += len([p for p in shape.text_frame.paragraphs if p.text.strip()])
+                        # Count bullet points (text_frame.text joins paragraphs with "\n")
+                        bullet_count += sum(1 for line in shape_text.split("\n") if line.strip())
             
             total_text_length += slide_text_length
             
@@ -2180,16 +2497,16 @@ class StablePowerPointManager:
         
         # Calculate metrics
         analysis["metrics"] = {
-            "total_slides": len(prs.slides),
+            "total_slides": slide_count,
             "slides_with_title": slides_with_title,
             "slides_with_bullets": slides_with_bullets,
             "empty_slides": empty_slides,
-            "avg_text_length": total_text_length / len(prs.slides) if prs.slides else 0,
+            "avg_text_length": total_text_length / slide_count if slide_count else 0,
             "avg_bullets_per_slide": sum(bullet_counts) / len(bullet_counts) if bullet_counts else 0
         }
         
         # Evaluate content quality
-        title_ratio = slides_with_title / len(prs.slides) if prs.slides else 0
+        title_ratio = slides_with_title / slide_count if slide_count else 0
         
         if title_ratio > 0.8:
             analysis["strengths"].append("Most slides have clear titles")
@@ -2199,7 +2516,7 @@ class StablePowerPointManager:
                 "category": "content",
                 "slide": "global",
                 "issue": "Missing slide titles",
-                "description": f"Only {slides_with_title} of {len(prs.slides)} slides have clear titles"
+                "description": f"Only {slides_with_title} of {slide_count} slides have clear titles"
             })
         
         if empty_slides > 0:
@@ -2208,15 +2525,16 @@ class StablePowerPointManager:
         # Calculate score
         score = 80
         score -= empty_slides * 10
-        score -= len([i for i in analysis["issues"] if i["type"] == "critical"]) * 15
-        score -= len([i for i in analysis["issues"] if i["type"] == "warning"]) * 5
+        issue_types = Counter(i["type"] for i in analysis["issues"])
+        score -= issue_types["critical"] * 15
+        score -= issue_types["warning"] * 5
         score += len(analysis["strengths"]) * 5
         
         analysis["score"] = max(0, min(100, score))
         
         return analysis
 
-    def _analyze_accessibility(self, prs) -> Dict[str, Any]:
+    def _analyze_accessibility(self, slide_shapes: List[List[Any]]) -> Dict[str, Any]:
         """Analyze accessibility aspects"""
         analysis = {
             "score": 0,
@@ -2230,10 +2548,10 @@ class StablePowerPointManager:
         total_images = 0
         low_contrast_issues = 0
         
-        for slide_idx, slide in enumerate(prs.slides):
-            for shape in slide.shapes:
+        for shapes in slide_shapes:
+            for shape in shapes:
                 # Check images for alt text
-                if hasattr(shape, 'image') or 'Picture' in str(type(shape)):
+                if isinstance(shape, Picture):
                     total_images += 1
                     # Note: python-pptx doesn't easily expose alt text, so this is a placeholder
                     # In a real implementation, you'd check shape.element for alt text
@@ -2241,18 +2559,19 @@ class StablePowerPointManager:
                         alt_text_missing += 1
                 
                 # Check for potential contrast issues (simplified)
-                if hasattr(shape, 'text_frame') and shape.text_frame:
-                    for paragraph in shape.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            try:
-                                if run.font.color and hasattr(run.font.color, 'rgb'):
-                                    # Simplified contrast check
-                                    if run.font.color.rgb and run.font.color.rgb.red == run.font.color.rgb.blue == run.font.color.rgb.green:
-                                        # Gray text might have contrast issues
-                                        low_contrast_issues += 1
-                            except (TypeError, AttributeError):
-                                # Skip text with unsupported color types
-                                pass
+                if shape.has_text_frame:
+                    for run in _iter_runs(shape.text_frame):
+                        try:
+                            color = run.font.color
+                            if color and hasattr(color, 'rgb'):
+                                # Simplified contrast check
+                                rgb = color.rgb
+                                if rgb and rgb.red == rgb.blue == rgb.green:
+                                    # Gray text might have contrast issues
+                                    low_contrast_issues += 1
+                        except (TypeError, AttributeError):
+                            # Skip text with unsupported color types
+                            pass
         
         # Record metrics
         analysis["metrics"] = {
@@ -2292,7 +2611,7 @@ class StablePowerPointManager:
         
         return analysis
 
-    def _analyze_technical_quality(self, file_path: str, prs) -> Dict[str, Any]:
+    def _analyze_technical_quality(self, file_path: str, slide_shapes: List[List[Any]]) -> Dict[str, Any]:
         """Analyze technical aspects of the presentation"""
         analysis = {
             "score": 0,
@@ -2307,7 +2626,7 @@ class StablePowerPointManager:
         file_size_mb = file_size / (1024 * 1024)
         
         # Slide count analysis
-        slide_count = len(prs.slides)
+        slide_count = len(slide_shapes)
         
         # Performance metrics
         analysis["metrics"] = {
@@ -2346,9 +2665,9 @@ class StablePowerPointManager:
         
         # Check for embedded objects and potential issues
         embedded_objects = 0
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, 'chart') or hasattr(shape, 'table'):
+        for shapes in slide_shapes:
+            for shape in shapes:
+                if shape.has_chart or shape.has_table:
                     embedded_objects += 1
         
         analysis["metrics"]["embedded_objects"] = embedded_objects
@@ -2364,8 +2683,9 @@ class StablePowerPointManager:
         
         # Calculate technical score
         score = 90
-        score -= len([i for i in analysis["issues"] if i["type"] == "critical"]) * 20
-        score -= len([i for i in analysis["issues"] if i["type"] == "warning"]) * 10
+        issue_types = Counter(i["type"] for i in analysis["issues"])
+        score -= issue_types["critical"] * 20
+        score -= issue_types["warning"] * 10
         
         if file_size_mb < 10 and slide_count < 30:
             analysis["strengths"].append("Optimized file size and slide count")
@@ -2387,9 +2707,10 @@ class StablePowerPointManager:
         issues = critique_results["issues"]
         recommendations = critique_results["recommendations"]
         
-        # Count issue types
-        critical_issues = len([i for i in issues if i.get("type") == "critical"])
-        warnings = len([i for i in issues if i.get("type") == "warning"])
+        # Count issue types in one pass
+        issue_types = Counter(i.get("type") for i in issues)
+        critical_issues = issue_types["critical"]
+        warnings = issue_types["warning"]
         
         # Calculate overall score
         detailed_analysis = critique_results["detailed_analysis"]
@@ -2430,1358 +2751,1372 @@ class StablePowerPointManager:
 server = Server("powerpoint-mcp-stable")
 ppt_manager = StablePowerPointManager()
 
-@server.list_tools()
-async def handle_list_tools() -> List[Tool]:
-    """List the core essential tools including deletion and file management capabilities"""
-    return [
-        Tool(
-            name="create_presentation",
-            description="Create a new PowerPoint presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
-                "additionalProperties": False
-            }
-        ),
-        Tool(
-            name="load_presentation",
-            description="Load an existing PowerPoint presentation from file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Path to the PowerPoint file to load"}
+# Tool definitions never change at runtime, so build them once at import
+# Schema properties shared by most tools
+_PROP_PRESENTATION_ID = {"type": "string", "description": "Presentation ID"}
+_PROP_SLIDE_INDEX = {"type": "integer", "description": "Slide index (0-based)", "minimum": 0}
+_PROP_TARGET_SLIDE_INDEX = {
+    "type": "integer",
+    "description": (
+        "Slide index (0-based); blank slides are added up to this index if it does not exist yet, "
+        f"at most {_MAX_AUTO_CREATED_SLIDES} per call"
+    ),
+    "minimum": 0,
+}
+_PROP_SHAPE_INDEX = {"type": "integer", "description": "Shape index (0-based)", "minimum": 0}
+_PROP_TABLE_INDEX = {"type": "integer", "description": "Table index on slide (0-based)", "minimum": 0}
+_PROP_LEFT = {"type": "number", "default": 1, "description": "Left position in inches"}
+_PROP_TOP = {"type": "number", "default": 1, "description": "Top position in inches"}
+
+TOOLS: List[Tool] = [
+    Tool(
+        name="create_presentation",
+        description="Create a new PowerPoint presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+            "additionalProperties": False
+        }
+    ),
+    Tool(
+        name="load_presentation",
+        description="Load an existing PowerPoint presentation from file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to the PowerPoint file to load"}
+            },
+            "required": ["file_path"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "file_path": "existing_presentation.pptx"
                 },
-                "required": ["file_path"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "file_path": "existing_presentation.pptx"
-                    },
-                    {
-                        "file_path": "C:\\Documents\\quarterly_report.pptx"
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="add_slide",
-            description="Add a new slide to a presentation with specified layout",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "layout_index": {"type": "integer", "description": "Slide layout index (0=title, 1=title+content, 6=blank, etc.)", "default": 6, "minimum": 0}
+                {
+                    "file_path": "C:\\Documents\\quarterly_report.pptx"
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="add_slide",
+        description="Add a new slide to a presentation with specified layout",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "layout_index": {"type": "integer", "description": "Slide layout index (0=title, 1=title+content, 6=blank, etc.)", "default": 6, "minimum": 0}
+            },
+            "required": ["presentation_id"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "layout_index": 1
                 },
-                "required": ["presentation_id"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "layout_index": 1
-                    },
-                    {
-                        "presentation_id": "ppt_0",
-                        "layout_index": 6
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="add_text_box",
-            description="Add a text box to a slide with comprehensive formatting options",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "text": {"type": "string", "description": "Text content"},
-                    "left": {"type": "number", "default": 1, "description": "Left position in inches"},
-                    "top": {"type": "number", "default": 1, "description": "Top position in inches"},
-                    "width": {"type": "number", "default": 8, "description": "Width in inches"},
-                    "height": {"type": "number", "default": 1, "description": "Height in inches"},
-                    "font_size": {"type": "integer", "default": 18, "minimum": 8, "maximum": 72, "description": "Font size in points"},
-                    "font_name": {"type": "string", "default": "Calibri", "description": "Font family name (e.g., Calibri, Arial, Times New Roman)"},
-                    "font_color": {"type": "string", "description": "Font color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
-                    "bold": {"type": "boolean", "default": False, "description": "Bold text"},
-                    "italic": {"type": "boolean", "default": False, "description": "Italic text"},
-                    "underline": {"type": "boolean", "default": False, "description": "Underline text"},
-                    "text_alignment": {"type": "string", "enum": ["left", "center", "right", "justify"], "default": "left", "description": "Text alignment"},
-                    "fill_color": {"type": "string", "description": "Background fill color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
-                    "border_color": {"type": "string", "description": "Border color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
-                    "border_width": {"type": "number", "default": 0, "minimum": 0, "description": "Border width in points (0 = no border)"}
+                {
+                    "presentation_id": "ppt_0",
+                    "layout_index": 6
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="add_text_box",
+        description="Add a text box to a slide with comprehensive formatting options",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_TARGET_SLIDE_INDEX,
+                "text": {"type": "string", "description": "Text content"},
+                "left": _PROP_LEFT,
+                "top": _PROP_TOP,
+                "width": {"type": "number", "default": 8, "description": "Width in inches"},
+                "height": {"type": "number", "default": 1, "description": "Height in inches"},
+                "font_size": {"type": "integer", "default": 18, "minimum": 8, "maximum": 72, "description": "Font size in points"},
+                "font_name": {"type": "string", "default": "Calibri", "description": "Font family name (e.g., Calibri, Arial, Times New Roman)"},
+                "font_color": {"type": "string", "description": "Font color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
+                "bold": {"type": "boolean", "default": False, "description": "Bold text"},
+                "italic": {"type": "boolean", "default": False, "description": "Italic text"},
+                "underline": {"type": "boolean", "default": False, "description": "Underline text"},
+                "text_alignment": {"type": "string", "enum": ["left", "center", "right", "justify"], "default": "left", "description": "Text alignment"},
+                "fill_color": {"type": "string", "description": "Background fill color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
+                "border_color": {"type": "string", "description": "Border color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
+                "border_width": {"type": "number", "default": 0, "minimum": 0, "description": "Border width in points (0 = no border)"}
+            },
+            "required": ["presentation_id", "slide_index", "text"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 0,
+                    "text": "Welcome to Our Presentation",
+                    "font_size": 32,
+                    "font_name": "Arial",
+                    "font_color": "#0066CC",
+                    "bold": True,
+                    "text_alignment": "center"
                 },
-                "required": ["presentation_id", "slide_index", "text"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 0,
-                        "text": "Welcome to Our Presentation",
-                        "font_size": 32,
-                        "font_name": "Arial",
-                        "font_color": "#0066CC",
-                        "bold": True,
-                        "text_alignment": "center"
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "text": "Key Points",
+                    "font_color": "white",
+                    "fill_color": "#4472C4",
+                    "border_color": "black",
+                    "border_width": 2
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="add_image",
+        description="Add an image to a slide from URL or local file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_TARGET_SLIDE_INDEX,
+                "image_source": {"type": "string", "description": "Image URL or local file path"},
+                "left": _PROP_LEFT,
+                "top": _PROP_TOP,
+                "width": {"type": "number", "description": "Width in inches (optional)"},
+                "height": {"type": "number", "description": "Height in inches (optional)"}
+            },
+            "required": ["presentation_id", "slide_index", "image_source"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "image_source": "https://example.com/chart.png",
+                    "width": 6,
+                    "height": 4
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="add_chart",
+        description="Add a chart to a slide with data series",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_TARGET_SLIDE_INDEX,
+                "chart_type": {"type": "string", "enum": ["column", "bar", "line", "pie", "area"]},
+                "categories": {"type": "array", "items": {"type": "string"}, "description": "Chart categories"},
+                "series_data": {
+                    "type": "object",
+                    "additionalProperties": {
+                        "type": "array",
+                        "items": {"type": "number"}
                     },
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "text": "Key Points",
-                        "font_color": "white",
-                        "fill_color": "#4472C4",
-                        "border_color": "black",
-                        "border_width": 2
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="add_image",
-            description="Add an image to a slide from URL or local file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "image_source": {"type": "string", "description": "Image URL or local file path"},
-                    "left": {"type": "number", "default": 1, "description": "Left position in inches"},
-                    "top": {"type": "number", "default": 1, "description": "Top position in inches"},
-                    "width": {"type": "number", "description": "Width in inches (optional)"},
-                    "height": {"type": "number", "description": "Height in inches (optional)"}
+                    "description": "Series data as {series_name: [values]}"
                 },
-                "required": ["presentation_id", "slide_index", "image_source"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "image_source": "https://example.com/chart.png",
-                        "width": 6,
-                        "height": 4
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="add_chart",
-            description="Add a chart to a slide with data series",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "chart_type": {"type": "string", "enum": ["column", "bar", "line", "pie", "area"]},
-                    "categories": {"type": "array", "items": {"type": "string"}, "description": "Chart categories"},
+                "left": {"type": "number", "default": 2},
+                "top": {"type": "number", "default": 2},
+                "width": {"type": "number", "default": 6},
+                "height": {"type": "number", "default": 4.5}
+            },
+            "required": ["presentation_id", "slide_index", "chart_type", "categories", "series_data"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 2,
+                    "chart_type": "column",
+                    "categories": ["Q1", "Q2", "Q3", "Q4"],
                     "series_data": {
-                        "type": "object",
-                        "additionalProperties": {
-                            "type": "array",
-                            "items": {"type": "number"}
-                        },
-                        "description": "Series data as {series_name: [values]}"
-                    },
-                    "left": {"type": "number", "default": 2},
-                    "top": {"type": "number", "default": 2},
-                    "width": {"type": "number", "default": 6},
-                    "height": {"type": "number", "default": 4.5}
-                },
-                "required": ["presentation_id", "slide_index", "chart_type", "categories", "series_data"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 2,
-                        "chart_type": "column",
-                        "categories": ["Q1", "Q2", "Q3", "Q4"],
-                        "series_data": {
-                            "Sales": [10, 15, 12, 18],
-                            "Profit": [3, 5, 4, 7]
-                        }
+                        "Sales": [10, 15, 12, 18],
+                        "Profit": [3, 5, 4, 7]
                     }
-                ]
-            }
-        ),
-        Tool(
-            name="save_presentation",
-            description="Save presentation to a file (handles both relative and absolute Windows paths)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "file_path": {"type": "string", "description": "Output file path - can be relative (e.g., 'output/file.pptx') or absolute (e.g., 'C:\\Users\\name\\Documents\\file.pptx')"}
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="save_presentation",
+        description="Save presentation to a file (handles both relative and absolute Windows paths)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "file_path": {"type": "string", "description": "Output file path - can be relative (e.g., 'output/file.pptx') or absolute (e.g., 'C:\\Users\\name\\Documents\\file.pptx')"}
+            },
+            "required": ["presentation_id", "file_path"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "file_path": "my_presentation.pptx"
                 },
-                "required": ["presentation_id", "file_path"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "file_path": "my_presentation.pptx"
-                    },
-                    {
-                        "presentation_id": "ppt_0", 
-                        "file_path": "output/my_presentation.pptx"
-                    },
-                    {
-                        "presentation_id": "ppt_0",
-                        "file_path": "C:\\Users\\username\\Documents\\my_presentation.pptx"
-                    }
-                                 ]
-             }
-        ),
-        Tool(
-            name="extract_text",
-            description="Extract all text content from a presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"}
+                {
+                    "presentation_id": "ppt_0", 
+                    "file_path": "output/my_presentation.pptx"
                 },
-                "required": ["presentation_id"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0"
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="get_presentation_info",
-            description="Get comprehensive information about a presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"}
+                {
+                    "presentation_id": "ppt_0",
+                    "file_path": "C:\\Users\\username\\Documents\\my_presentation.pptx"
+                }
+                             ]
+         }
+    ),
+    Tool(
+        name="extract_text",
+        description="Extract all text content from a presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID
+            },
+            "required": ["presentation_id"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0"
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="get_presentation_info",
+        description="Get comprehensive information about a presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID
+            },
+            "required": ["presentation_id"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0"
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="delete_shape",
+        description="Delete a specific shape from a slide by index",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX,
+                "shape_index": _PROP_SHAPE_INDEX
+            },
+            "required": ["presentation_id", "slide_index", "shape_index"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 0,
+                    "shape_index": 1
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="delete_slide",
+        description="Delete an entire slide from the presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX
+            },
+            "required": ["presentation_id", "slide_index"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 2
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="clear_slide",
+        description="Clear all content from a slide but keep the slide",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX
+            },
+            "required": ["presentation_id", "slide_index"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="list_slide_content",
+        description="List all shapes on a slide to help with targeted deletion",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX
+            },
+            "required": ["presentation_id", "slide_index"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 0
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="format_existing_text",
+        description="Modify formatting of existing text shapes on slides",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX,
+                "shape_index": _PROP_SHAPE_INDEX,
+                "font_size": {"type": "integer", "minimum": 8, "maximum": 72, "description": "Font size in points"},
+                "font_name": {"type": "string", "description": "Font family name (e.g., Arial, Calibri)"},
+                "font_color": {"type": "string", "description": "Font color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
+                "bold": {"type": "boolean", "description": "Bold text"},
+                "italic": {"type": "boolean", "description": "Italic text"},
+                "underline": {"type": "boolean", "description": "Underline text"},
+                "text_alignment": {"type": "string", "enum": ["left", "center", "right", "justify"], "description": "Text alignment"}
+            },
+            "required": ["presentation_id", "slide_index", "shape_index"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 0,
+                    "shape_index": 1,
+                    "font_size": 24,
+                    "font_color": "#FF0000",
+                    "bold": True
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="set_slide_background",
+        description="Set slide background color or image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX,
+                "background_color": {"type": "string", "description": "Background color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
+                "background_image": {"type": "string", "description": "Background image URL or local file path"}
+            },
+            "required": ["presentation_id", "slide_index"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 0,
+                    "background_color": "#E6F3FF"
                 },
-                "required": ["presentation_id"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0"
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="delete_shape",
-            description="Delete a specific shape from a slide by index",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "shape_index": {"type": "integer", "description": "Shape index (0-based)", "minimum": 0}
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "background_image": "https://example.com/background.jpg"
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="add_table",
+        description="Add a table to a slide with specified dimensions and optional header styling",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_TARGET_SLIDE_INDEX,
+                "rows": {"type": "integer", "description": "Number of rows", "minimum": 1, "maximum": 50},
+                "cols": {"type": "integer", "description": "Number of columns", "minimum": 1, "maximum": 20},
+                "left": _PROP_LEFT,
+                "top": _PROP_TOP,
+                "width": {"type": "number", "default": 8, "description": "Width in inches"},
+                "height": {"type": "number", "default": 4, "description": "Height in inches"},
+                "header_row": {"type": "boolean", "default": False, "description": "Style first row as header with blue background"}
+            },
+            "required": ["presentation_id", "slide_index", "rows", "cols"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "rows": 4,
+                    "cols": 3,
+                    "header_row": True
                 },
-                "required": ["presentation_id", "slide_index", "shape_index"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 0,
-                        "shape_index": 1
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="delete_slide",
-            description="Delete an entire slide from the presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0}
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 2,
+                    "rows": 5,
+                    "cols": 4,
+                    "left": 2,
+                    "top": 2,
+                    "width": 6,
+                    "height": 3
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="set_table_cell",
+        description="Set text content and formatting for a specific table cell",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX,
+                "table_index": _PROP_TABLE_INDEX,
+                "row": {"type": "integer", "description": "Row index (0-based)", "minimum": 0},
+                "col": {"type": "integer", "description": "Column index (0-based)", "minimum": 0},
+                "text": {"type": "string", "description": "Text content for the cell"},
+                "font_size": {"type": "integer", "minimum": 8, "maximum": 72, "description": "Font size in points"},
+                "font_name": {"type": "string", "description": "Font family name (e.g., Arial, Calibri)"},
+                "font_color": {"type": "string", "description": "Font color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
+                "bold": {"type": "boolean", "description": "Bold text"},
+                "italic": {"type": "boolean", "description": "Italic text"},
+                "underline": {"type": "boolean", "description": "Underline text"},
+                "text_alignment": {"type": "string", "enum": ["left", "center", "right", "justify"], "description": "Text alignment within cell"}
+            },
+            "required": ["presentation_id", "slide_index", "table_index", "row", "col", "text"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_index": 0,
+                    "row": 0,
+                    "col": 0,
+                    "text": "Product Name",
+                    "bold": True,
+                    "font_size": 14
                 },
-                "required": ["presentation_id", "slide_index"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 2
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="clear_slide",
-            description="Clear all content from a slide but keep the slide",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0}
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_index": 0,
+                    "row": 1,
+                    "col": 1,
+                    "text": "$125.99",
+                    "font_color": "#008000",
+                    "text_alignment": "right"
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="get_table_info",
+        description="Get comprehensive information about a table including dimensions and cell contents",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX,
+                "table_index": _PROP_TABLE_INDEX
+            },
+            "required": ["presentation_id", "slide_index", "table_index"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_index": 0
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="style_table_cell",
+        description="Apply styling to a specific table cell (background color, borders, margins)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX,
+                "table_index": _PROP_TABLE_INDEX,
+                "row": {"type": "integer", "description": "Row index (0-based)", "minimum": 0},
+                "col": {"type": "integer", "description": "Column index (0-based)", "minimum": 0},
+                "fill_color": {"type": "string", "description": "Cell background color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
+                "border_color": {"type": "string", "description": "Border color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
+                "border_width": {"type": "number", "description": "Border width in points", "minimum": 0},
+                "margin_left": {"type": "number", "description": "Left margin in inches", "minimum": 0},
+                "margin_right": {"type": "number", "description": "Right margin in inches", "minimum": 0},
+                "margin_top": {"type": "number", "description": "Top margin in inches", "minimum": 0},
+                "margin_bottom": {"type": "number", "description": "Bottom margin in inches", "minimum": 0}
+            },
+            "required": ["presentation_id", "slide_index", "table_index", "row", "col"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_index": 0,
+                    "row": 0,
+                    "col": 0,
+                    "fill_color": "#4472C4",
+                    "border_color": "black",
+                    "border_width": 1
                 },
-                "required": ["presentation_id", "slide_index"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="list_slide_content",
-            description="List all shapes on a slide to help with targeted deletion",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0}
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_index": 0,
+                    "row": 1,
+                    "col": 1,
+                    "fill_color": "#E6F3FF",
+                    "margin_left": 0.1,
+                    "margin_right": 0.1
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="style_table_range",
+        description="Apply styling to a range of table cells simultaneously",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX,
+                "table_index": _PROP_TABLE_INDEX,
+                "start_row": {"type": "integer", "description": "Starting row index (0-based)", "minimum": 0},
+                "start_col": {"type": "integer", "description": "Starting column index (0-based)", "minimum": 0},
+                "end_row": {"type": "integer", "description": "Ending row index (0-based)", "minimum": 0},
+                "end_col": {"type": "integer", "description": "Ending column index (0-based)", "minimum": 0},
+                "fill_color": {"type": "string", "description": "Cell background color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
+                "border_color": {"type": "string", "description": "Border color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
+                "border_width": {"type": "number", "description": "Border width in points", "minimum": 0},
+                "margin_left": {"type": "number", "description": "Left margin in inches", "minimum": 0},
+                "margin_right": {"type": "number", "description": "Right margin in inches", "minimum": 0},
+                "margin_top": {"type": "number", "description": "Top margin in inches", "minimum": 0},
+                "margin_bottom": {"type": "number", "description": "Bottom margin in inches", "minimum": 0}
+            },
+            "required": ["presentation_id", "slide_index", "table_index", "start_row", "start_col", "end_row", "end_col"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_index": 0,
+                    "start_row": 0,
+                    "start_col": 0,
+                    "end_row": 0,
+                    "end_col": 2,
+                    "fill_color": "#4472C4",
+                    "border_color": "black",
+                    "border_width": 1
                 },
-                "required": ["presentation_id", "slide_index"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 0
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="format_existing_text",
-            description="Modify formatting of existing text shapes on slides",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "shape_index": {"type": "integer", "description": "Shape index (0-based)", "minimum": 0},
-                    "font_size": {"type": "integer", "minimum": 8, "maximum": 72, "description": "Font size in points"},
-                    "font_name": {"type": "string", "description": "Font family name (e.g., Arial, Calibri)"},
-                    "font_color": {"type": "string", "description": "Font color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
-                    "bold": {"type": "boolean", "description": "Bold text"},
-                    "italic": {"type": "boolean", "description": "Italic text"},
-                    "underline": {"type": "boolean", "description": "Underline text"},
-                    "text_alignment": {"type": "string", "enum": ["left", "center", "right", "justify"], "description": "Text alignment"}
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_index": 0,
+                    "start_row": 1,
+                    "start_col": 0,
+                    "end_row": 3,
+                    "end_col": 2,
+                    "fill_color": "#F2F2F2"
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="create_table_with_data",
+        description="Create a table and populate it with data in one operation (convenience method)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX,
+                "table_data": {
+                    "type": "array",
+                    "items": {
+                        "type": "array",
+                        "items": {"type": "string"}
+                    },
+                    "description": "2D array of table data (rows and columns)"
                 },
-                "required": ["presentation_id", "slide_index", "shape_index"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 0,
-                        "shape_index": 1,
-                        "font_size": 24,
-                        "font_color": "#FF0000",
-                        "bold": True
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="set_slide_background",
-            description="Set slide background color or image",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "background_color": {"type": "string", "description": "Background color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
-                    "background_image": {"type": "string", "description": "Background image URL or local file path"}
+                "headers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional header row"
                 },
-                "required": ["presentation_id", "slide_index"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 0,
-                        "background_color": "#E6F3FF"
-                    },
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "background_image": "https://example.com/background.jpg"
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="add_table",
-            description="Add a table to a slide with specified dimensions and optional header styling",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "rows": {"type": "integer", "description": "Number of rows", "minimum": 1, "maximum": 50},
-                    "cols": {"type": "integer", "description": "Number of columns", "minimum": 1, "maximum": 20},
-                    "left": {"type": "number", "default": 1, "description": "Left position in inches"},
-                    "top": {"type": "number", "default": 1, "description": "Top position in inches"},
-                    "width": {"type": "number", "default": 8, "description": "Width in inches"},
-                    "height": {"type": "number", "default": 4, "description": "Height in inches"},
-                    "header_row": {"type": "boolean", "default": False, "description": "Style first row as header with blue background"}
+                "left": _PROP_LEFT,
+                "top": _PROP_TOP,
+                "width": {"type": "number", "default": 8, "description": "Width in inches"},
+                "height": {"type": "number", "default": 4, "description": "Height in inches"},
+                "header_style": {
+                    "type": "object",
+                    "description": "Style options for header row (font_size, font_color, bold, etc.)"
                 },
-                "required": ["presentation_id", "slide_index", "rows", "cols"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "rows": 4,
-                        "cols": 3,
-                        "header_row": True
-                    },
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 2,
-                        "rows": 5,
-                        "cols": 4,
-                        "left": 2,
-                        "top": 2,
-                        "width": 6,
-                        "height": 3
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="set_table_cell",
-            description="Set text content and formatting for a specific table cell",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "table_index": {"type": "integer", "description": "Table index on slide (0-based)", "minimum": 0},
-                    "row": {"type": "integer", "description": "Row index (0-based)", "minimum": 0},
-                    "col": {"type": "integer", "description": "Column index (0-based)", "minimum": 0},
-                    "text": {"type": "string", "description": "Text content for the cell"},
-                    "font_size": {"type": "integer", "minimum": 8, "maximum": 72, "description": "Font size in points"},
-                    "font_name": {"type": "string", "description": "Font family name (e.g., Arial, Calibri)"},
-                    "font_color": {"type": "string", "description": "Font color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
-                    "bold": {"type": "boolean", "description": "Bold text"},
-                    "italic": {"type": "boolean", "description": "Italic text"},
-                    "underline": {"type": "boolean", "description": "Underline text"},
-                    "text_alignment": {"type": "string", "enum": ["left", "center", "right", "justify"], "description": "Text alignment within cell"}
+                "data_style": {
+                    "type": "object",
+                    "description": "Style options for data cells (font_size, font_color, etc.)"
                 },
-                "required": ["presentation_id", "slide_index", "table_index", "row", "col", "text"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_index": 0,
-                        "row": 0,
-                        "col": 0,
-                        "text": "Product Name",
-                        "bold": True,
-                        "font_size": 14
-                    },
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_index": 0,
-                        "row": 1,
-                        "col": 1,
-                        "text": "$125.99",
-                        "font_color": "#008000",
-                        "text_alignment": "right"
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="get_table_info",
-            description="Get comprehensive information about a table including dimensions and cell contents",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "table_index": {"type": "integer", "description": "Table index on slide (0-based)", "minimum": 0}
+                "alternating_rows": {"type": "boolean", "default": False, "description": "Apply alternating row background colors"}
+            },
+            "required": ["presentation_id", "slide_index", "table_data"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_data": [
+                        ["John", "25", "Engineer"],
+                        ["Jane", "30", "Manager"],
+                        ["Bob", "28", "Designer"]
+                    ],
+                    "headers": ["Name", "Age", "Role"],
+                    "alternating_rows": True
                 },
-                "required": ["presentation_id", "slide_index", "table_index"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_index": 0
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="style_table_cell",
-            description="Apply styling to a specific table cell (background color, borders, margins)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "table_index": {"type": "integer", "description": "Table index on slide (0-based)", "minimum": 0},
-                    "row": {"type": "integer", "description": "Row index (0-based)", "minimum": 0},
-                    "col": {"type": "integer", "description": "Column index (0-based)", "minimum": 0},
-                    "fill_color": {"type": "string", "description": "Cell background color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
-                    "border_color": {"type": "string", "description": "Border color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
-                    "border_width": {"type": "number", "description": "Border width in points", "minimum": 0},
-                    "margin_left": {"type": "number", "description": "Left margin in inches", "minimum": 0},
-                    "margin_right": {"type": "number", "description": "Right margin in inches", "minimum": 0},
-                    "margin_top": {"type": "number", "description": "Top margin in inches", "minimum": 0},
-                    "margin_bottom": {"type": "number", "description": "Bottom margin in inches", "minimum": 0}
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 2,
+                    "table_data": [
+                        ["Q1", "100", "120"],
+                        ["Q2", "110", "135"],
+                        ["Q3", "105", "125"],
+                        ["Q4", "115", "140"]
+                    ],
+                    "headers": ["Quarter", "Sales", "Target"],
+                    "header_style": {"bold": True, "font_size": 14},
+                    "data_style": {"font_size": 12}
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="modify_table_structure",
+        description="Modify table structure by adding or removing rows and columns",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "presentation_id": _PROP_PRESENTATION_ID,
+                "slide_index": _PROP_SLIDE_INDEX,
+                "table_index": _PROP_TABLE_INDEX,
+                "operation": {
+                    "type": "string", 
+                    "enum": ["add_row", "remove_row", "add_column", "remove_column"],
+                    "description": "Type of structure modification to perform"
                 },
-                "required": ["presentation_id", "slide_index", "table_index", "row", "col"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_index": 0,
-                        "row": 0,
-                        "col": 0,
-                        "fill_color": "#4472C4",
-                        "border_color": "black",
-                        "border_width": 1
-                    },
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_index": 0,
-                        "row": 1,
-                        "col": 1,
-                        "fill_color": "#E6F3FF",
-                        "margin_left": 0.1,
-                        "margin_right": 0.1
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="style_table_range",
-            description="Apply styling to a range of table cells simultaneously",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "table_index": {"type": "integer", "description": "Table index on slide (0-based)", "minimum": 0},
-                    "start_row": {"type": "integer", "description": "Starting row index (0-based)", "minimum": 0},
-                    "start_col": {"type": "integer", "description": "Starting column index (0-based)", "minimum": 0},
-                    "end_row": {"type": "integer", "description": "Ending row index (0-based)", "minimum": 0},
-                    "end_col": {"type": "integer", "description": "Ending column index (0-based)", "minimum": 0},
-                    "fill_color": {"type": "string", "description": "Cell background color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
-                    "border_color": {"type": "string", "description": "Border color - hex (#FF0000), RGB (255,0,0), or name (red, blue, etc.)"},
-                    "border_width": {"type": "number", "description": "Border width in points", "minimum": 0},
-                    "margin_left": {"type": "number", "description": "Left margin in inches", "minimum": 0},
-                    "margin_right": {"type": "number", "description": "Right margin in inches", "minimum": 0},
-                    "margin_top": {"type": "number", "description": "Top margin in inches", "minimum": 0},
-                    "margin_bottom": {"type": "number", "description": "Bottom margin in inches", "minimum": 0}
+                "position": {
+                    "type": "integer",
+                    "description": "Position to insert/remove at (0-based). If not specified: add operations append to end, remove operations remove from end",
+                    "minimum": 0
                 },
-                "required": ["presentation_id", "slide_index", "table_index", "start_row", "start_col", "end_row", "end_col"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_index": 0,
-                        "start_row": 0,
-                        "start_col": 0,
-                        "end_row": 0,
-                        "end_col": 2,
-                        "fill_color": "#4472C4",
-                        "border_color": "black",
-                        "border_width": 1
-                    },
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_index": 0,
-                        "start_row": 1,
-                        "start_col": 0,
-                        "end_row": 3,
-                        "end_col": 2,
-                        "fill_color": "#F2F2F2"
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="create_table_with_data",
-            description="Create a table and populate it with data in one operation (convenience method)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "table_data": {
-                        "type": "array",
-                        "items": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        },
-                        "description": "2D array of table data (rows and columns)"
-                    },
-                    "headers": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Optional header row"
-                    },
-                    "left": {"type": "number", "default": 1, "description": "Left position in inches"},
-                    "top": {"type": "number", "default": 1, "description": "Top position in inches"},
-                    "width": {"type": "number", "default": 8, "description": "Width in inches"},
-                    "height": {"type": "number", "default": 4, "description": "Height in inches"},
-                    "header_style": {
-                        "type": "object",
-                        "description": "Style options for header row (font_size, font_color, bold, etc.)"
-                    },
-                    "data_style": {
-                        "type": "object",
-                        "description": "Style options for data cells (font_size, font_color, etc.)"
-                    },
-                    "alternating_rows": {"type": "boolean", "default": False, "description": "Apply alternating row background colors"}
+                "count": {
+                    "type": "integer",
+                    "default": 1,
+                    "minimum": 1,
+                    "maximum": 20,
+                    "description": "Number of rows/columns to add or remove"
+                }
+            },
+            "required": ["presentation_id", "slide_index", "table_index", "operation"],
+            "additionalProperties": False,
+            "examples": [
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_index": 0,
+                    "operation": "add_row",
+                    "position": 2,
+                    "count": 1
                 },
-                "required": ["presentation_id", "slide_index", "table_data"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_data": [
-                            ["John", "25", "Engineer"],
-                            ["Jane", "30", "Manager"],
-                            ["Bob", "28", "Designer"]
-                        ],
-                        "headers": ["Name", "Age", "Role"],
-                        "alternating_rows": True
-                    },
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 2,
-                        "table_data": [
-                            ["Q1", "100", "120"],
-                            ["Q2", "110", "135"],
-                            ["Q3", "105", "125"],
-                            ["Q4", "115", "140"]
-                        ],
-                        "headers": ["Quarter", "Sales", "Target"],
-                        "header_style": {"bold": True, "font_size": 14},
-                        "data_style": {"font_size": 12}
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="modify_table_structure",
-            description="Modify table structure by adding or removing rows and columns",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string", "description": "Presentation ID"},
-                    "slide_index": {"type": "integer", "description": "Slide index (0-based)", "minimum": 0},
-                    "table_index": {"type": "integer", "description": "Table index on slide (0-based)", "minimum": 0},
-                    "operation": {
-                        "type": "string", 
-                        "enum": ["add_row", "remove_row", "add_column", "remove_column"],
-                        "description": "Type of structure modification to perform"
-                    },
-                    "position": {
-                        "type": "integer",
-                        "description": "Position to insert/remove at (0-based). If not specified: add operations append to end, remove operations remove from end",
-                        "minimum": 0
-                    },
-                    "count": {
-                        "type": "integer",
-                        "default": 1,
-                        "minimum": 1,
-                        "maximum": 20,
-                        "description": "Number of rows/columns to add or remove"
-                    }
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_index": 0,
+                    "operation": "remove_column",
+                    "count": 2
                 },
-                "required": ["presentation_id", "slide_index", "table_index", "operation"],
-                "additionalProperties": False,
-                "examples": [
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_index": 0,
-                        "operation": "add_row",
-                        "position": 2,
-                        "count": 1
-                    },
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_index": 0,
-                        "operation": "remove_column",
-                        "count": 2
-                    },
-                    {
-                        "presentation_id": "ppt_0",
-                        "slide_index": 1,
-                        "table_index": 0,
-                        "operation": "add_column",
-                        "position": 0,
-                        "count": 1
-                    }
-                ]
-            }
-        ),
-        Tool(
-            name="get_presentation_info",
-            description="Get information about a presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "presentation_id": {"type": "string"}
+                {
+                    "presentation_id": "ppt_0",
+                    "slide_index": 1,
+                    "table_index": 0,
+                    "operation": "add_column",
+                    "position": 0,
+                    "count": 1
+                }
+            ]
+        }
+    ),
+    Tool(
+        name="screenshot_slides",
+        description="Screenshot each slide of a PowerPoint presentation for vision review (Windows only)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the PowerPoint file"
                 },
-                "required": ["presentation_id"]
-            }
-        ),
-        Tool(
-            name="screenshot_slides",
-            description="Screenshot each slide of a PowerPoint presentation for vision review (Windows only)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the PowerPoint file"
-                    },
-                    "output_dir": {
-                        "type": "string",
-                        "description": "Directory to save screenshots (optional, defaults to temp directory)"
-                    },
-                    "image_format": {
-                        "type": "string",
-                        "description": "Image format (PNG, JPG, etc.)",
-                        "default": "PNG"
-                    },
-                    "width": {
-                        "type": "integer",
-                        "description": "Screenshot width in pixels",
-                        "default": 1920
-                    },
-                    "height": {
-                        "type": "integer",
-                        "description": "Screenshot height in pixels",  
-                        "default": 1080
-                    }
+                "output_dir": {
+                    "type": "string",
+                    "description": "Directory to save screenshots (optional, defaults to temp directory)"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="critique_presentation",
-            description="Analyze and critique a PowerPoint presentation for design, content, accessibility, and technical issues",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the PowerPoint file to analyze"
-                    },
-                    "critique_type": {
-                        "type": "string",
-                        "enum": ["design", "content", "accessibility", "technical", "comprehensive"],
-                        "default": "comprehensive",
-                        "description": "Type of critique to perform"
-                    },
-                    "include_screenshots": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Whether to generate screenshots for visual analysis"
-                    },
-                    "output_dir": {
-                        "type": "string",
-                        "description": "Directory to save screenshots if generated (optional)"
-                    }
+                "image_format": {
+                    "type": "string",
+                    "description": "Image format (PNG, JPG, etc.)",
+                    "default": "PNG"
                 },
-                "required": ["file_path"]
-            }
-        )
-    ]
+                "width": {
+                    "type": "integer",
+                    "description": "Screenshot width in pixels",
+                    "default": 1920
+                },
+                "height": {
+                    "type": "integer",
+                    "description": "Screenshot height in pixels",  
+                    "default": 1080
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="critique_presentation",
+        description="Analyze and critique a PowerPoint presentation for design, content, accessibility, and technical issues",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the PowerPoint file to analyze"
+                },
+                "critique_type": {
+                    "type": "string",
+                    "enum": ["design", "content", "accessibility", "technical", "comprehensive"],
+                    "default": "comprehensive",
+                    "description": "Type of critique to perform"
+                },
+                "include_screenshots": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Whether to generate screenshots for visual analysis"
+                },
+                "output_dir": {
+                    "type": "string",
+                    "description": "Directory to save screenshots if generated (optional)"
+                }
+            },
+            "required": ["file_path"]
+        }
+    )
+]
 
-@server.call_tool()
-async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-    """Handle tool calls with validation and enhanced feedback"""
+# Schema defaults per tool as flat (argument, value) pairs, filled in once per call
+_TOOL_DEFAULTS: Dict[str, Tuple[Tuple[str, Any], ...]] = {
+    tool.name: tuple(
+        (prop, spec["default"])
+        for prop, spec in tool.inputSchema.get("properties", {}).items()
+        if "default" in spec
+    )
+    for tool in TOOLS
+}
+
+def _apply_tool_defaults(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill in schema defaults for any arguments the caller left out"""
+    defaults = _TOOL_DEFAULTS.get(tool_name)
+    if not defaults:
+        return arguments
+    filled = dict(arguments)
+    for prop, value in defaults:
+        filled.setdefault(prop, value)
+    return filled
+
+@server.list_tools()
+async def handle_list_tools() -> List[Tool]:
+    """List the core essential tools including deletion and file management capabilities"""
+    return TOOLS
+
+# =============================================================================
+# TOOL HANDLERS
+# =============================================================================
+
+async def _handle_create_presentation(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Create a new PowerPoint presentation"""
+    prs_id = ppt_manager.create_presentation()
+    message = format_success_message("create_presentation", presentation_id=prs_id)
+    return [TextContent(type="text", text=message)]
+
+async def _handle_load_presentation(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Load an existing PowerPoint presentation from file"""
+    file_path = validated_args["file_path"]
+    
+    prs_id = await ppt_manager.load_presentation_async(file_path)
+    
+    # Get info for success message
+    prs = ppt_manager._get_presentation(prs_id)
+    slide_count = len(prs.slides)
+    
+    message = format_success_message(
+        "load_presentation", presentation_id=prs_id, file_path=file_path, slide_count=slide_count
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_add_slide(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Add a new slide to a presentation with specified layout"""
+    prs_id = validated_args["presentation_id"]
+    layout_index = validated_args["layout_index"]
+    
+    slide_index = ppt_manager.add_slide(prs_id, layout_index)
+    
+    # Get info for success message (the new slide is always appended last)
+    total_slides = slide_index + 1
+    
+    # add_slide succeeded, so layout_index is valid for the cached layout listing
+    layout_name = ppt_manager._get_available_layouts(prs_id)[layout_index]["name"]
+    
+    message = format_success_message(
+        "add_slide", slide_index=slide_index, layout_index=layout_index, 
+        layout_name=layout_name, total_slides=total_slides
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_add_text_box(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Add a text box to a slide with comprehensive formatting options"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    text = validated_args["text"]
+    left = validated_args["left"]
+    top = validated_args["top"]
+    width = validated_args["width"]
+    height = validated_args["height"]
+    font_size = validated_args["font_size"]
+    font_name = validated_args["font_name"]
+    font_color = validated_args.get("font_color")
+    bold = validated_args["bold"]
+    italic = validated_args["italic"]
+    underline = validated_args["underline"]
+    text_alignment = validated_args["text_alignment"]
+    fill_color = validated_args.get("fill_color")
+    border_color = validated_args.get("border_color")
+    border_width = validated_args["border_width"]
+    
+    success = ppt_manager.add_text_box(
+        prs_id, slide_index, text, left, top, width, height, font_size, font_name, font_color,
+        bold, italic, underline, text_alignment, fill_color, border_color, border_width
+    )
+    
+    message = format_success_message(
+        "add_text_box", slide_index=slide_index, font_size=font_size, font_name=font_name, 
+        text_alignment=text_alignment, font_color=font_color, fill_color=fill_color, text=text
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_add_image(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Add an image to a slide from URL or local file"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    image_source = validated_args["image_source"]
+    left = validated_args["left"]
+    top = validated_args["top"]
+    width = validated_args.get("width")
+    height = validated_args.get("height")
+    
+    success = await ppt_manager.add_image_async(
+        prs_id, slide_index, image_source, left, top, width, height
+    )
+    
+    message = format_success_message(
+        "add_image", slide_index=slide_index, image_source=image_source
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_add_chart(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Add a chart to a slide with data series"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    chart_type = validated_args["chart_type"]
+    categories = validated_args["categories"]
+    series_data = validated_args["series_data"]
+    left = validated_args["left"]
+    top = validated_args["top"]
+    width = validated_args["width"]
+    height = validated_args["height"]
     
+    success = ppt_manager.add_chart(
+        prs_id, slide_index, chart_type, categories, series_data, left, top, width, height
+    )
+    
+    message = format_success_message(
+        "add_chart", slide_index=slide_index, chart_type=chart_type, 
+        categories=categories, series_data=series_data
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_save_presentation(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Save presentation to a file (handles both relative and absolute Windows paths)"""
+    prs_id = validated_args["presentation_id"]
+    file_path = validated_args["file_path"]
+    
+    saved_path, file_data = await ppt_manager.save_presentation_async(prs_id, file_path)
+    
+    # Return with embedded resource for immediate access (the bytes just written)
     try:
-        # Validate arguments
-        validated_args = validate_basic_args(name, arguments)
-        
-        if name == "create_presentation":
-            prs_id = ppt_manager.create_presentation()
-            message = format_success_message(name, presentation_id=prs_id)
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "load_presentation":
-            file_path = validated_args["file_path"]
-            
-            prs_id = ppt_manager.load_presentation(file_path)
-            
-            # Get info for success message
-            prs = ppt_manager.presentations[prs_id]
-            slide_count = len(prs.slides)
-            
-            message = format_success_message(
-                name, presentation_id=prs_id, file_path=file_path, slide_count=slide_count
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "add_slide":
-            prs_id = validated_args["presentation_id"]
-            layout_index = validated_args.get("layout_index", 6)
-            
-            slide_index = ppt_manager.add_slide(prs_id, layout_index)
-            
-            # Get info for success message
-            prs = ppt_manager.presentations[prs_id]
-            total_slides = len(prs.slides)
-            
-            # Try to get layout name
-            try:
-                layout_name = prs.slide_layouts[layout_index].name
-            except:
-                layout_name = f"Layout {layout_index}"
-            
-            message = format_success_message(
-                name, slide_index=slide_index, layout_index=layout_index, 
-                layout_name=layout_name, total_slides=total_slides
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "add_text_box":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            text = validated_args["text"]
-            left = validated_args.get("left", 1)
-            top = validated_args.get("top", 1)
-            width = validated_args.get("width", 8)
-            height = validated_args.get("height", 1)
-            font_size = validated_args.get("font_size", 18)
-            font_name = validated_args.get("font_name", "Calibri")
-            font_color = validated_args.get("font_color")
-            bold = validated_args.get("bold", False)
-            italic = validated_args.get("italic", False)
-            underline = validated_args.get("underline", False)
-            text_alignment = validated_args.get("text_alignment", "left")
-            fill_color = validated_args.get("fill_color")
-            border_color = validated_args.get("border_color")
-            border_width = validated_args.get("border_width", 0)
-            
-            success = ppt_manager.add_text_box(
-                prs_id, slide_index, text, left, top, width, height, font_size, font_name, font_color,
-                bold, italic, underline, text_alignment, fill_color, border_color, border_width
-            )
-            
-            message = format_success_message(
-                name, slide_index=slide_index, font_size=font_size, font_name=font_name, 
-                text_alignment=text_alignment, font_color=font_color, fill_color=fill_color, text=text
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "add_image":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            image_source = validated_args["image_source"]
-            left = validated_args.get("left", 1)
-            top = validated_args.get("top", 1)
-            width = validated_args.get("width")
-            height = validated_args.get("height")
-            
-            success = ppt_manager.add_image(
-                prs_id, slide_index, image_source, left, top, width, height
-            )
-            
-            message = format_success_message(
-                name, slide_index=slide_index, image_source=image_source
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "add_chart":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            chart_type = validated_args["chart_type"]
-            categories = validated_args["categories"]
-            series_data = validated_args["series_data"]
-            left = validated_args.get("left", 2)
-            top = validated_args.get("top", 2)
-            width = validated_args.get("width", 6)
-            height = validated_args.get("height", 4.5)
-            
-            success = ppt_manager.add_chart(
-                prs_id, slide_index, chart_type, categories, series_data, left, top, width, height
-            )
-            
-            message = format_success_message(
-                name, slide_index=slide_index, chart_type=chart_type, 
-                categories=categories, series_data=series_data
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "save_presentation":
-            prs_id = validated_args["presentation_id"]
-            file_path = validated_args["file_path"]
-            
-            saved_path = ppt_manager.save_presentation(prs_id, file_path)
-            
-            # Return with embedded resource for immediate access
-            try:
-                with open(saved_path, 'rb') as f:
-                    file_data = f.read()
-                
-                message = format_success_message(name, file_path=saved_path)
-                
-                return [
-                    TextContent(type="text", text=message),
-                    EmbeddedResource(
-                        type="resource",
-                        resource=EmbeddedResource(
-                            uri=f"file://{saved_path}",
-                            mimeType="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                            data=file_data
-                        )
-                    )
-                ]
-            except Exception as e:
-                # Fallback to text message only
-                message = format_success_message(name, file_path=saved_path)
-                return [TextContent(type="text", text=message)]
-        
-        elif name == "extract_text":
-            prs_id = validated_args["presentation_id"]
-            
-            extracted_text = ppt_manager.extract_text(prs_id)
-            
-            # Count total text items
-            text_items = sum(len(slide["text_content"]) for slide in extracted_text)
-            slide_count = len(extracted_text)
-            
-            message = format_success_message(
-                name, slide_count=slide_count, text_items=text_items
-            )
-            
-            # Format the extracted text for display
-            if extracted_text:
-                text_summary = []
-                for slide in extracted_text:
-                    if slide["text_content"]:
-                        slide_text = f"Slide {slide['slide_number']}:"
-                        for item in slide["text_content"]:
-                            preview = item["text"][:80] + "..." if len(item["text"]) > 80 else item["text"]
-                            slide_text += f"\n  - {preview}"
-                        text_summary.append(slide_text)
-                
-                if text_summary:
-                    full_message = f"{message}\n\n" + "\n\n".join(text_summary)
-                else:
-                    full_message = f"{message}\n(No text content found)"
-            else:
-                full_message = f"{message}\n(No slides found)"
-            
-            return [TextContent(type="text", text=full_message)]
-        
-        elif name == "get_presentation_info":
-            prs_id = validated_args["presentation_id"]
-            
-            info = ppt_manager.get_presentation_info(prs_id)
-            
-            message = format_success_message(
-                name, slide_count=info["slide_count"], total_shapes=info["total_shapes"]
+        message = format_success_message("save_presentation", file_path=saved_path)
+        
+        return [
+            TextContent(type="text", text=message),
+            EmbeddedResource(
+                type="resource",
+                resource=EmbeddedResource(
+                    uri=f"file://{saved_path}",
+                    mimeType="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                    data=file_data
+                )
             )
-            
-            # Format comprehensive info
-            content_summary = info["content_summary"]
-            available_layouts = info["available_layouts"]
-            
-            info_details = f"""📊 Content Summary:
+        ]
+    except Exception as e:
+        # Fallback to text message only
+        message = format_success_message("save_presentation", file_path=saved_path)
+        return [TextContent(type="text", text=message)]
+
+async def _handle_extract_text(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Extract all text content from a presentation"""
+    prs_id = validated_args["presentation_id"]
+    
+    extracted_text = ppt_manager.extract_text(prs_id)
+    
+    # Count total text items
+    text_items = sum(len(slide["text_content"]) for slide in extracted_text)
+    slide_count = len(extracted_text)
+    
+    message = format_success_message(
+        "extract_text", slide_count=slide_count, text_items=text_items
+    )
+    
+    # Format the extracted text for display
+    if extracted_text:
+        text_summary = []
+        for slide in extracted_text:
+            if slide["text_content"]:
+                slide_lines = [f"Slide {slide['slide_number']}:"]
+                for item in slide["text_content"]:
+                    text = item["text"]
+                    preview = text[:80] + "..." if len(text) > 80 else text
+                    slide_lines.append(f"  - {preview}")
+                text_summary.append("\n".join(slide_lines))
+        
+        if text_summary:
+            full_message = f"{message}\n\n" + "\n\n".join(text_summary)
+        else:
+            full_message = f"{message}\n(No text content found)"
+    else:
+        full_message = f"{message}\n(No slides found)"
+    
+    return [TextContent(type="text", text=full_message)]
+
+async def _handle_get_presentation_info(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Get comprehensive information about a presentation"""
+    prs_id = validated_args["presentation_id"]
+    
+    info = ppt_manager.get_presentation_info(prs_id)
+    
+    message = format_success_message(
+        "get_presentation_info", slide_count=info["slide_count"], total_shapes=info["total_shapes"]
+    )
+    
+    # Format comprehensive info
+    content_summary = info["content_summary"]
+    available_layouts = info["available_layouts"]
+    
+    info_details = f"""📊 Content Summary:
   • Text boxes: {content_summary['text_boxes']}
   • Images: {content_summary['images']}
   • Charts: {content_summary['charts']}
   • Other shapes: {content_summary['other_shapes']}
 
 🎨 Available Layouts:"""
-            
-            for layout in available_layouts[:5]:  # Show first 5 layouts
-                info_details += f"\n  [{layout['index']}] {layout['name']}"
-            
-            if len(available_layouts) > 5:
-                info_details += f"\n  ... and {len(available_layouts) - 5} more layouts"
-            
-            full_message = f"{message}\n\n{info_details}"
-            return [TextContent(type="text", text=full_message)]
-        
-        elif name == "delete_shape":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            shape_index = validated_args["shape_index"]
-            
-            # Get shape type before deletion for better message
-            prs = ppt_manager.presentations[prs_id]
-            slide = prs.slides[slide_index]
-            shape = slide.shapes[shape_index]
-            shape_type = "shape"
-            try:
-                if hasattr(shape, 'text_frame'):
-                    shape_type = "text box"
-                elif hasattr(shape, 'chart'):
-                    shape_type = "chart"
-                elif hasattr(shape, 'image'):
-                    shape_type = "image"
-            except:
-                pass
-            
-            success = ppt_manager.delete_shape(prs_id, slide_index, shape_index)
-            message = format_success_message(
-                name, slide_index=slide_index, shape_index=shape_index, shape_type=shape_type
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "delete_slide":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            
-            # Get slide count before deletion
-            prs = ppt_manager.presentations[prs_id]
-            original_count = len(prs.slides)
-            
-            success = ppt_manager.delete_slide(prs_id, slide_index)
-            remaining_slides = original_count - 1
-            message = format_success_message(
-                name, slide_index=slide_index, remaining_slides=remaining_slides
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "clear_slide":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            
-            # Get shape count before clearing
-            prs = ppt_manager.presentations[prs_id]
-            slide = prs.slides[slide_index]
-            shapes_cleared = len(slide.shapes)
-            
-            success = ppt_manager.clear_slide(prs_id, slide_index)
-            message = format_success_message(
-                name, slide_index=slide_index, shapes_cleared=shapes_cleared
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "list_slide_content":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            
-            content = ppt_manager.list_slide_content(prs_id, slide_index)
-            message = format_success_message(
-                name, slide_index=slide_index, shape_count=content["shape_count"]
-            )
-            
-            # Format the detailed content list
-            if content["shapes"]:
-                content_list = "\n".join([
-                    f"  [{shape['index']}] {shape['type']}: {shape['description']}"
-                    for shape in content["shapes"]
-                ])
-                full_message = f"{message}\n{content_list}"
-            else:
-                full_message = f"{message}\n  (No shapes on this slide)"
-            
-            return [TextContent(type="text", text=full_message)]
-        
-        elif name == "format_existing_text":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            shape_index = validated_args["shape_index"]
-            font_size = validated_args.get("font_size")
-            font_name = validated_args.get("font_name")
-            font_color = validated_args.get("font_color")
-            bold = validated_args.get("bold")
-            italic = validated_args.get("italic")
-            underline = validated_args.get("underline")
-            text_alignment = validated_args.get("text_alignment")
-            
-            success = ppt_manager.format_existing_text(
-                prs_id, slide_index, shape_index, font_size, font_name, font_color,
-                bold, italic, underline, text_alignment
-            )
-            
-            message = format_success_message(
-                name, slide_index=slide_index, shape_index=shape_index,
-                font_size=font_size, font_name=font_name, font_color=font_color, text_alignment=text_alignment
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "set_slide_background":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            background_color = validated_args.get("background_color")
-            background_image = validated_args.get("background_image")
-            
-            success = ppt_manager.set_slide_background(
-                prs_id, slide_index, background_color, background_image
-            )
-            
-            message = format_success_message(
-                name, slide_index=slide_index, background_color=background_color, background_image=background_image
-            )
-            return [TextContent(type="text", text=message)]
-        
-        # Table operations - Phase 1 handlers
-        elif name == "add_table":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            rows = validated_args["rows"]
-            cols = validated_args["cols"]
-            left = validated_args.get("left", 1)
-            top = validated_args.get("top", 1)
-            width = validated_args.get("width", 8)
-            height = validated_args.get("height", 4)
-            header_row = validated_args.get("header_row", False)
-            
-            table_index = ppt_manager.add_table(
-                prs_id, slide_index, rows, cols, left, top, width, height, header_row
-            )
-            
-            message = format_success_message(
-                name, slide_index=slide_index, rows=rows, cols=cols, header_row=header_row
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "set_table_cell":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            table_index = validated_args["table_index"]
-            row = validated_args["row"]
-            col = validated_args["col"]
-            text = validated_args["text"]
-            font_size = validated_args.get("font_size")
-            font_name = validated_args.get("font_name")
-            font_color = validated_args.get("font_color")
-            bold = validated_args.get("bold")
-            italic = validated_args.get("italic")
-            underline = validated_args.get("underline")
-            text_alignment = validated_args.get("text_alignment")
-            
-            success = ppt_manager.set_table_cell(
-                prs_id, slide_index, table_index, row, col, text,
-                font_size, font_name, font_color, bold, italic, underline, text_alignment
-            )
-            
-            message = format_success_message(
-                name, slide_index=slide_index, table_index=table_index, row=row, col=col, text=text
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "get_table_info":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            table_index = validated_args["table_index"]
-            
-            info = ppt_manager.get_table_info(prs_id, slide_index, table_index)
-            
-            message = format_success_message(
-                name, slide_index=slide_index, table_index=table_index, 
-                rows=info["rows"], cols=info["columns"], total_cells=info["total_cells"]
-            )
-            
-            # Format detailed table info
-            table_details = f"""📊 Table Structure:
+    
+    for layout in available_layouts[:5]:  # Show first 5 layouts
+        info_details += f"\n  [{layout['index']}] {layout['name']}"
+    
+    if len(available_layouts) > 5:
+        info_details += f"\n  ... and {len(available_layouts) - 5} more layouts"
+    
+    full_message = f"{message}\n\n{info_details}"
+    return [TextContent(type="text", text=full_message)]
+
+async def _handle_delete_shape(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Delete a specific shape from a slide by index"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    shape_index = validated_args["shape_index"]
+    
+    # Get shape type before deletion for better message
+    prs = ppt_manager._get_presentation(prs_id)
+    slide = prs.slides[slide_index]
+    shape = slide.shapes[shape_index]
+    shape_type = "shape"
+    try:
+        if shape.has_text_frame:
+            shape_type = "text box"
+        elif shape.has_chart:
+            shape_type = "chart"
+        elif isinstance(shape, Picture):
+            shape_type = "image"
+    except:
+        pass
+    
+    success = ppt_manager.delete_shape(prs_id, slide_index, shape_index)
+    message = format_success_message(
+        "delete_shape", slide_index=slide_index, shape_index=shape_index, shape_type=shape_type
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_delete_slide(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Delete an entire slide from the presentation"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    
+    # Get slide count before deletion
+    prs = ppt_manager._get_presentation(prs_id)
+    original_count = len(prs.slides)
+    
+    success = ppt_manager.delete_slide(prs_id, slide_index)
+    remaining_slides = original_count - 1
+    message = format_success_message(
+        "delete_slide", slide_index=slide_index, remaining_slides=remaining_slides
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_clear_slide(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Clear all content from a slide but keep the slide"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    
+    # Get shape count before clearing
+    prs = ppt_manager._get_presentation(prs_id)
+    slide = prs.slides[slide_index]
+    shapes_cleared = len(slide.shapes)
+    
+    success = ppt_manager.clear_slide(prs_id, slide_index)
+    message = format_success_message(
+        "clear_slide", slide_index=slide_index, shapes_cleared=shapes_cleared
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_list_slide_content(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """List all shapes on a slide to help with targeted deletion"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    
+    content = ppt_manager.list_slide_content(prs_id, slide_index)
+    message = format_success_message(
+        "list_slide_content", slide_index=slide_index, shape_count=content["shape_count"]
+    )
+    
+    # Format the detailed content list
+    if content["shapes"]:
+        content_list = "\n".join([
+            f"  [{shape['index']}] {shape['type']}: {shape['description']}"
+            for shape in content["shapes"]
+        ])
+        full_message = f"{message}\n{content_list}"
+    else:
+        full_message = f"{message}\n  (No shapes on this slide)"
+    
+    return [TextContent(type="text", text=full_message)]
+
+async def _handle_format_existing_text(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Modify formatting of existing text shapes on slides"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    shape_index = validated_args["shape_index"]
+    font_size = validated_args.get("font_size")
+    font_name = validated_args.get("font_name")
+    font_color = validated_args.get("font_color")
+    bold = validated_args.get("bold")
+    italic = validated_args.get("italic")
+    underline = validated_args.get("underline")
+    text_alignment = validated_args.get("text_alignment")
+    
+    success = ppt_manager.format_existing_text(
+        prs_id, slide_index, shape_index, font_size, font_name, font_color,
+        bold, italic, underline, text_alignment
+    )
+    
+    message = format_success_message(
+        "format_existing_text", slide_index=slide_index, shape_index=shape_index,
+        font_size=font_size, font_name=font_name, font_color=font_color, text_alignment=text_alignment
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_set_slide_background(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Set slide background color or image"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    background_color = validated_args.get("background_color")
+    background_image = validated_args.get("background_image")
+    
+    success = await ppt_manager.set_slide_background_async(
+        prs_id, slide_index, background_color, background_image
+    )
+    
+    message = format_success_message(
+        "set_slide_background", slide_index=slide_index, background_color=background_color, background_image=background_image
+    )
+    return [TextContent(type="text", text=message)]
+
+# Table operations - Phase 1 handlers
+
+async def _handle_add_table(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Add a table to a slide with specified dimensions and optional header styling"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    rows = validated_args["rows"]
+    cols = validated_args["cols"]
+    left = validated_args["left"]
+    top = validated_args["top"]
+    width = validated_args["width"]
+    height = validated_args["height"]
+    header_row = validated_args["header_row"]
+    
+    table_index = ppt_manager.add_table(
+        prs_id, slide_index, rows, cols, left, top, width, height, header_row
+    )
+    
+    message = format_success_message(
+        "add_table", slide_index=slide_index, rows=rows, cols=cols, header_row=header_row
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_set_table_cell(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Set text content and formatting for a specific table cell"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    table_index = validated_args["table_index"]
+    row = validated_args["row"]
+    col = validated_args["col"]
+    text = validated_args["text"]
+    font_size = validated_args.get("font_size")
+    font_name = validated_args.get("font_name")
+    font_color = validated_args.get("font_color")
+    bold = validated_args.get("bold")
+    italic = validated_args.get("italic")
+    underline = validated_args.get("underline")
+    text_alignment = validated_args.get("text_alignment")
+    
+    success = ppt_manager.set_table_cell(
+        prs_id, slide_index, table_index, row, col, text,
+        font_size, font_name, font_color, bold, italic, underline, text_alignment
+    )
+    
+    message = format_success_message(
+        "set_table_cell", slide_index=slide_index, table_index=table_index, row=row, col=col, text=text
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_get_table_info(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Get comprehensive information about a table including dimensions and cell contents"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    table_index = validated_args["table_index"]
+    
+    info = ppt_manager.get_table_info(prs_id, slide_index, table_index)
+    
+    message = format_success_message(
+        "get_table_info", slide_index=slide_index, table_index=table_index, 
+        rows=info["rows"], cols=info["columns"], total_cells=info["total_cells"]
+    )
+    
+    # Format detailed table info
+    table_details = f"""📊 Table Structure:
   • Dimensions: {info['rows']} rows × {info['columns']} columns
   • Total cells: {info['total_cells']}
 
 📝 Cell Contents:"""
-            
-            # Show first few rows of content
-            for row_idx, row_data in enumerate(info['cell_data'][:3]):  # Show first 3 rows
-                row_content = []
-                for cell_data in row_data:
-                    cell_text = cell_data['text']
-                    if cell_text:
-                        # Truncate long cell content for display
-                        display_text = cell_text[:15] + "..." if len(cell_text) > 15 else cell_text
-                        row_content.append(f'"{display_text}"')
-                    else:
-                        row_content.append('""')
-                
-                table_details += f"\n  Row {row_idx}: {' | '.join(row_content)}"
-            
-            if len(info['cell_data']) > 3:
-                table_details += f"\n  ... and {len(info['cell_data']) - 3} more rows"
-            
-            full_message = f"{message}\n\n{table_details}"
-            return [TextContent(type="text", text=full_message)]
-        
-        # Table operations - Phase 2 handlers
-        elif name == "style_table_cell":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            table_index = validated_args["table_index"]
-            row = validated_args["row"]
-            col = validated_args["col"]
-            fill_color = validated_args.get("fill_color")
-            border_color = validated_args.get("border_color")
-            border_width = validated_args.get("border_width")
-            margin_left = validated_args.get("margin_left")
-            margin_right = validated_args.get("margin_right")
-            margin_top = validated_args.get("margin_top")
-            margin_bottom = validated_args.get("margin_bottom")
-            
-            success = ppt_manager.style_table_cell(
-                prs_id, slide_index, table_index, row, col,
-                fill_color, border_color, border_width,
-                margin_left, margin_right, margin_top, margin_bottom
-            )
-            
-            message = format_success_message(
-                name, slide_index=slide_index, table_index=table_index, row=row, col=col,
-                fill_color=fill_color, border_color=border_color
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "style_table_range":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            table_index = validated_args["table_index"]
-            start_row = validated_args["start_row"]
-            start_col = validated_args["start_col"]
-            end_row = validated_args["end_row"]
-            end_col = validated_args["end_col"]
-            fill_color = validated_args.get("fill_color")
-            border_color = validated_args.get("border_color")
-            border_width = validated_args.get("border_width")
-            margin_left = validated_args.get("margin_left")
-            margin_right = validated_args.get("margin_right")
-            margin_top = validated_args.get("margin_top")
-            margin_bottom = validated_args.get("margin_bottom")
-            
-            success = ppt_manager.style_table_range(
-                prs_id, slide_index, table_index, start_row, start_col, end_row, end_col,
-                fill_color, border_color, border_width,
-                margin_left, margin_right, margin_top, margin_bottom
-            )
-            
-            message = format_success_message(
-                name, slide_index=slide_index, table_index=table_index,
-                start_row=start_row, start_col=start_col, end_row=end_row, end_col=end_col
-            )
-            return [TextContent(type="text", text=message)]
-        
-        elif name == "create_table_with_data":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            table_data = validated_args["table_data"]
-            headers = validated_args.get("headers")
-            left = validated_args.get("left", 1)
-            top = validated_args.get("top", 1)
-            width = validated_args.get("width", 8)
-            height = validated_args.get("height", 4)
-            header_style = validated_args.get("header_style", {})
-            data_style = validated_args.get("data_style", {})
-            alternating_rows = validated_args.get("alternating_rows", False)
-            
-            table_index = ppt_manager.create_table_with_data(
-                prs_id, slide_index, table_data, headers, left, top, width, height,
-                header_style, data_style, alternating_rows
-            )
-            
-            # Calculate table dimensions for success message
-            rows = len(table_data) + (1 if headers else 0)
-            cols = len(table_data[0]) if table_data else 0
-            
-            message = format_success_message(
-                "add_table", slide_index=slide_index, rows=rows, cols=cols, header_row=bool(headers)
-            )
-            
-            # Add data population info
-            data_summary = f"\n📊 Populated with {len(table_data)} data rows"
-            if headers:
-                data_summary += f" and {len(headers)} headers"
-            if alternating_rows:
-                data_summary += " (alternating row colors)"
-            
-            full_message = f"{message}{data_summary}"
-            return [TextContent(type="text", text=full_message)]
-        
-        elif name == "modify_table_structure":
-            prs_id = validated_args["presentation_id"]
-            slide_index = validated_args["slide_index"]
-            table_index = validated_args["table_index"]
-            operation = validated_args["operation"]
-            position = validated_args.get("position")
-            count = validated_args.get("count", 1)
-            
-            success = ppt_manager.modify_table_structure(
-                prs_id, slide_index, table_index, operation, position, count
-            )
-            
-            message = format_success_message(
-                name, slide_index=slide_index, table_index=table_index,
-                operation=operation, position=position, count=count
-            )
-            return [TextContent(type="text", text=message)]
+    
+    # Show first few rows of content
+    for row_idx, row_data in enumerate(info['cell_data'][:3]):  # Show first 3 rows
+        row_content = []
+        for cell_data in row_data:
+            cell_text = cell_data['text']
+            if cell_text:
+                # Truncate long cell content for display
+                display_text = cell_text[:15] + "..." if len(cell_text) > 15 else cell_text
+                row_content.append(f'"{display_text}"')
+            else:
+                row_content.append('""')
         
-        elif name == "get_presentation_info":
-            prs_id = validated_args["presentation_id"]
-            
-            info = ppt_manager.get_presentation_info(prs_id)
-            
-            message = format_success_message(
-                name, slide_count=info["slide_count"], total_shapes=info["total_shapes"]
-            )
-            
-            # Format comprehensive info
-            content_summary = info["content_summary"]
-            available_layouts = info["available_layouts"]
-            
-            info_details = f"""📊 Content Summary:
-  • Text boxes: {content_summary['text_boxes']}
-  • Images: {content_summary['images']}
-  • Charts: {content_summary['charts']}
-  • Other shapes: {content_summary['other_shapes']}
+        table_details += f"\n  Row {row_idx}: {' | '.join(row_content)}"
+    
+    if len(info['cell_data']) > 3:
+        table_details += f"\n  ... and {len(info['cell_data']) - 3} more rows"
+    
+    full_message = f"{message}\n\n{table_details}"
+    return [TextContent(type="text", text=full_message)]
 
-🎨 Available Layouts:"""
-            
-            for layout in available_layouts[:5]:  # Show first 5 layouts
-                info_details += f"\n  [{layout['index']}] {layout['name']}"
-            
-            if len(available_layouts) > 5:
-                info_details += f"\n  ... and {len(available_layouts) - 5} more layouts"
-            
-            full_message = f"{message}\n\n{info_details}"
-            return [TextContent(type="text", text=full_message)]
-        
-        elif name == "screenshot_slides":
-            file_path = validated_args["file_path"]
-            output_dir = validated_args.get("output_dir")
-            image_format = validated_args.get("image_format", "PNG")
-            width = validated_args.get("width", 1920)
-            height = validated_args.get("height", 1080)
-            
-            screenshot_paths = await ppt_manager.screenshot_slides_async(
-                file_path, output_dir, image_format, width, height
-            )
-            
-            result_info = {
-                "total_slides": len(screenshot_paths),
-                "screenshot_paths": screenshot_paths,
-                "image_format": image_format,
-                "dimensions": f"{width}x{height}",
-                "output_directory": os.path.dirname(screenshot_paths[0]) if screenshot_paths else None
-            }
-            
-            return [TextContent(
-                type="text",
-                text=f"Successfully created {len(screenshot_paths)} slide screenshots.\n" +
-                     json.dumps(result_info, indent=2)
-            )]
-        
-        elif name == "critique_presentation":
-            file_path = validated_args["file_path"]
-            critique_type = validated_args.get("critique_type", "comprehensive")
-            include_screenshots = validated_args.get("include_screenshots", True)
-            output_dir = validated_args.get("output_dir")
-            
-            critique_results = await ppt_manager.critique_presentation_async(
-                file_path, critique_type, include_screenshots, output_dir
-            )
-            
-            # Format the critique results for display
-            summary = critique_results["summary"]
-            response_text = f"""🔍 Presentation Critique Complete
+# Table operations - Phase 2 handlers
+
+async def _handle_style_table_cell(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Apply styling to a specific table cell (background color, borders, margins)"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    table_index = validated_args["table_index"]
+    row = validated_args["row"]
+    col = validated_args["col"]
+    fill_color = validated_args.get("fill_color")
+    border_color = validated_args.get("border_color")
+    border_width = validated_args.get("border_width")
+    margin_left = validated_args.get("margin_left")
+    margin_right = validated_args.get("margin_right")
+    margin_top = validated_args.get("margin_top")
+    margin_bottom = validated_args.get("margin_bottom")
+    
+    success = ppt_manager.style_table_cell(
+        prs_id, slide_index, table_index, row, col,
+        fill_color, border_color, border_width,
+        margin_left, margin_right, margin_top, margin_bottom
+    )
+    
+    message = format_success_message(
+        "style_table_cell", slide_index=slide_index, table_index=table_index, row=row, col=col,
+        fill_color=fill_color, border_color=border_color
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_style_table_range(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Apply styling to a range of table cells simultaneously"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    table_index = validated_args["table_index"]
+    start_row = validated_args["start_row"]
+    start_col = validated_args["start_col"]
+    end_row = validated_args["end_row"]
+    end_col = validated_args["end_col"]
+    fill_color = validated_args.get("fill_color")
+    border_color = validated_args.get("border_color")
+    border_width = validated_args.get("border_width")
+    margin_left = validated_args.get("margin_left")
+    margin_right = validated_args.get("margin_right")
+    margin_top = validated_args.get("margin_top")
+    margin_bottom = validated_args.get("margin_bottom")
+    
+    success = ppt_manager.style_table_range(
+        prs_id, slide_index, table_index, start_row, start_col, end_row, end_col,
+        fill_color, border_color, border_width,
+        margin_left, margin_right, margin_top, margin_bottom
+    )
+    
+    message = format_success_message(
+        "style_table_range", slide_index=slide_index, table_index=table_index,
+        start_row=start_row, start_col=start_col, end_row=end_row, end_col=end_col
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_create_table_with_data(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Create a table and populate it with data in one operation (convenience method)"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    table_data = validated_args["table_data"]
+    headers = validated_args.get("headers")
+    left = validated_args["left"]
+    top = validated_args["top"]
+    width = validated_args["width"]
+    height = validated_args["height"]
+    header_style = validated_args.get("header_style", {})
+    data_style = validated_args.get("data_style", {})
+    alternating_rows = validated_args["alternating_rows"]
+    
+    table_index = ppt_manager.create_table_with_data(
+        prs_id, slide_index, table_data, headers, left, top, width, height,
+        header_style, data_style, alternating_rows
+    )
+    
+    # Calculate table dimensions for success message
+    rows = len(table_data) + (1 if headers else 0)
+    cols = len(table_data[0]) if table_data else 0
+    
+    message = format_success_message(
+        "add_table", slide_index=slide_index, rows=rows, cols=cols, header_row=bool(headers)
+    )
+    
+    # Add data population info
+    data_summary = f"\n📊 Populated with {len(table_data)} data rows"
+    if headers:
+        data_summary += f" and {len(headers)} headers"
+    if alternating_rows:
+        data_summary += " (alternating row colors)"
+    
+    full_message = f"{message}{data_summary}"
+    return [TextContent(type="text", text=full_message)]
+
+async def _handle_modify_table_structure(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Modify table structure by adding or removing rows and columns"""
+    prs_id = validated_args["presentation_id"]
+    slide_index = validated_args["slide_index"]
+    table_index = validated_args["table_index"]
+    operation = validated_args["operation"]
+    position = validated_args.get("position")
+    count = validated_args["count"]
+    
+    success = ppt_manager.modify_table_structure(
+        prs_id, slide_index, table_index, operation, position, count
+    )
+    
+    message = format_success_message(
+        "modify_table_structure", slide_index=slide_index, table_index=table_index,
+        operation=operation, position=position, count=count
+    )
+    return [TextContent(type="text", text=message)]
+
+async def _handle_screenshot_slides(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Screenshot each slide of a PowerPoint presentation for vision review (Windows only)"""
+    file_path = validated_args["file_path"]
+    output_dir = validated_args.get("output_dir")
+    image_format = validated_args["image_format"]
+    width = validated_args["width"]
+    height = validated_args["height"]
+    
+    screenshot_paths = await ppt_manager.screenshot_slides_async(
+        file_path, output_dir, image_format, width, height
+    )
+    
+    result_info = {
+        "total_slides": len(screenshot_paths),
+        "screenshot_paths": screenshot_paths,
+        "image_format": image_format,
+        "dimensions": f"{width}x{height}",
+        "output_directory": os.path.dirname(screenshot_paths[0]) if screenshot_paths else None
+    }
+    
+    return [TextContent(
+        type="text",
+        text=f"Successfully created {len(screenshot_paths)} slide screenshots.\n" +
+             _json_dumps(result_info)
+    )]
+
+async def _handle_critique_presentation(validated_args: Dict[str, Any]) -> List[TextContent]:
+    """Analyze and critique a PowerPoint presentation for design, content, accessibility, and technical issues"""
+    file_path = validated_args["file_path"]
+    critique_type = validated_args["critique_type"]
+    include_screenshots = validated_args["include_screenshots"]
+    output_dir = validated_args.get("output_dir")
+    
+    critique_results = await ppt_manager.critique_presentation_async(
+        file_path, critique_type, include_screenshots, output_dir
+    )
+    
+    # Format the critique results for display
+    summary = critique_results["summary"]
+    parts = [f"""🔍 Presentation Critique Complete
 
 📊 Overall Assessment: {summary['assessment']} (Score: {summary['overall_score']}/100)
 📈 Total Slides: {summary['total_slides']}
@@ -3791,65 +4126,103 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
 
 Analysis Categories: {', '.join(summary['analysis_categories'])}
 
-"""
-            
-            # Add issue details
-            if critique_results["issues"]:
-                response_text += "\n🚨 Issues Found:\n"
-                for issue in critique_results["issues"][:10]:  # Limit to first 10 issues
-                    emoji = "🔴" if issue["type"] == "critical" else "⚠️"
-                    slide_info = f"Slide {issue['slide']}" if issue['slide'] != 'global' else "Global"
-                    response_text += f"{emoji} {slide_info}: {issue['issue']} - {issue['description']}\n"
-                
-                if len(critique_results["issues"]) > 10:
-                    response_text += f"... and {len(critique_results['issues']) - 10} more issues\n"
-            
-            # Add strengths
-            if critique_results["strengths"]:
-                response_text += "\n✅ Strengths:\n"
-                for strength in critique_results["strengths"][:5]:
-                    response_text += f"• {strength}\n"
-            
-            # Add top recommendations
-            if critique_results["recommendations"]:
-                response_text += "\n💡 Top Recommendations:\n"
-                unique_recommendations = list(set(critique_results["recommendations"]))
-                for rec in unique_recommendations[:5]:
-                    response_text += f"• {rec}\n"
-            
-            # Add screenshot info if generated
-            if critique_results.get("screenshots"):
-                response_text += f"\n📸 Screenshots: {len(critique_results['screenshots'])} images generated\n"
-            
-            response_text += f"\n📋 Full detailed analysis available in JSON format below:\n"
-            
-            response = [
-                TextContent(
-                    type="text",
-                    text=response_text
-                ),
-                TextContent(
-                    type="text",
-                    text=json.dumps(critique_results, indent=2, default=str)
-                )
-            ]
-            
-            # Add screenshot references if generated
-            if critique_results.get("screenshots"):
-                for screenshot_path in critique_results["screenshots"]:
-                    if os.path.exists(screenshot_path):
-                        response.append(EmbeddedResource(
-                            uri=f"file://{os.path.abspath(screenshot_path)}",
-                            mimeType="image/png"
-                        ))
-            
-            return response
+"""]
+    
+    # Add issue details
+    issues = critique_results["issues"]
+    if issues:
+        parts.append("\n🚨 Issues Found:\n")
+        for issue in issues[:10]:  # Limit to first 10 issues
+            emoji = "🔴" if issue["type"] == "critical" else "⚠️"
+            slide_info = f"Slide {issue['slide']}" if issue['slide'] != 'global' else "Global"
+            parts.append(f"{emoji} {slide_info}: {issue['issue']} - {issue['description']}\n")
+        
+        if len(issues) > 10:
+            parts.append(f"... and {len(issues) - 10} more issues\n")
+    
+    # Add strengths
+    if critique_results["strengths"]:
+        parts.append("\n✅ Strengths:\n")
+        parts.extend(f"• {strength}\n" for strength in critique_results["strengths"][:5])
+    
+    # Add top recommendations
+    if critique_results["recommendations"]:
+        parts.append("\n💡 Top Recommendations:\n")
+        unique_recommendations = list(set(critique_results["recommendations"]))
+        parts.extend(f"• {rec}\n" for rec in unique_recommendations[:5])
+    
+    # Add screenshot info if generated
+    if critique_results.get("screenshots"):
+        parts.append(f"\n📸 Screenshots: {len(critique_results['screenshots'])} images generated\n")
+    
+    parts.append("\n📋 Full detailed analysis available in JSON format below:\n")
+    response_text = "".join(parts)
+    
+    response = [
+        TextContent(
+            type="text",
+            text=response_text
+        ),
+        TextContent(
+            type="text",
+            text=_json_dumps(critique_results)
+        )
+    ]
+    
+    # Add screenshot references if generated
+    if critique_results.get("screenshots"):
+        for screenshot_path in critique_results["screenshots"]:
+            if os.path.exists(screenshot_path):
+                response.append(EmbeddedResource(
+                    uri=f"file://{os.path.abspath(screenshot_path)}",
+                    mimeType="image/png"
+                ))
+    
+    return response
+
+# Tool name -> handler coroutine, built once at import
+_TOOL_HANDLERS = {
+    "create_presentation": _handle_create_presentation,
+    "load_presentation": _handle_load_presentation,
+    "add_slide": _handle_add_slide,
+    "add_text_box": _handle_add_text_box,
+    "add_image": _handle_add_image,
+    "add_chart": _handle_add_chart,
+    "save_presentation": _handle_save_presentation,
+    "extract_text": _handle_extract_text,
+    "get_presentation_info": _handle_get_presentation_info,
+    "delete_shape": _handle_delete_shape,
+    "delete_slide": _handle_delete_slide,
+    "clear_slide": _handle_clear_slide,
+    "list_slide_content": _handle_list_slide_content,
+    "format_existing_text": _handle_format_existing_text,
+    "set_slide_background": _handle_set_slide_background,
+    "add_table": _handle_add_table,
+    "set_table_cell": _handle_set_table_cell,
+    "get_table_info": _handle_get_table_info,
+    "style_table_cell": _handle_style_table_cell,
+    "style_table_range": _handle_style_table_range,
+    "create_table_with_data": _handle_create_table_with_data,
+    "modify_table_structure": _handle_modify_table_structure,
+    "screenshot_slides": _handle_screenshot_slides,
+    "critique_presentation": _handle_critique_presentation,
+}
+
+@server.call_tool()
+async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle tool calls with validation and enhanced feedback"""
+    
+    try:
+        # Validate arguments
+        validated_args = validate_basic_args(name, _apply_tool_defaults(name, arguments))
         
-        else:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return await handler(validated_args)
     
     except Exception as e:
-        logger.error(f"Error in tool {name}: {e}")
+        logger.error("Error in tool %s: %s", name, e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return [TextContent(
             type="text",
             text=f"Error: {str(e)}"
@@ -3872,7 +4245,9 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
+    finally:
+        ppt_manager.cleanup()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -70,6 +70,9 @@ setup(
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
             "pytest-cov>=4.0.0",
+        ],
+        "fast": [
+            "orjson>=3.8.0",
         ]
     },
     entry_points={
@@ -11,6 +11,7 @@ Phase 4 Implementation: Style Intelligence & Consistency
 import json
 import logging
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from collections import defaultdict, Counter
@@ -29,16 +30,27 @@ except ImportError as e:
 
 try:
     import numpy as np
-    from sklearn.cluster import KMeans
-    from sklearn.preprocessing import StandardScaler
 except ImportError as e:
-    print(f"Machine learning libraries not found: {e}")
-    print("Please install with: pip install scikit-learn numpy")
+    print(f"numpy library not found: {e}")
+    print("Please install with: pip install numpy")
     raise
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _load_sklearn():
+    """Import the scikit-learn clustering classes on first use, or return None if it is not installed"""
+    # scikit-learn is only needed for position clustering and is slow to import
+    try:
+        from sklearn.cluster import KMeans
+        from sklearn.preprocessing import StandardScaler
+    except ImportError as e:
+        logger.warning(f"scikit-learn not available ({e}) - falling back to exact position counts; "
+                       "install with: pip install scikit-learn")
+        return None
+    return KMeans, StandardScaler
+
 @dataclass
 class FontProfile:
     """Represents font styling information"""
@@ -262,11 +274,12 @@ class StyleAnalyzer:
         
         for slide in prs.slides:
             for shape in slide.shapes:
-                # Position analysis
-                left_inches = shape.left.inches if shape.left else 0
-                top_inches = shape.top.inches if shape.top else 0
-                width_inches = shape.width.inches if shape.width else 0
-                height_inches = shape.height.inches if shape.height else 0
+                # Position analysis (each extent is read from the XML once)
+                left, top, width, height = shape.left, shape.top, shape.width, shape.height
+                left_inches = left.inches if left else 0
+                top_inches = top.inches if top else 0
+                width_inches = width.inches if width else 0
+                height_inches = height.inches if height else 0
                 
                 positions.append((left_inches, top_inches))
                 sizes.append((width_inches, height_inches))
@@ -301,6 +314,11 @@ class StyleAnalyzer:
         if len(positions) < 2:
             return positions
         
+        sklearn_classes = _load_sklearn()
+        if sklearn_classes is None:
+            return self._most_common_positions(positions)
+        KMeans, StandardScaler = sklearn_classes
+        
         try:
             # Normalize positions for clustering
             positions_array = np.array(positions)
@@ -317,8 +335,12 @@ class StyleAnalyzer:
             return [tuple(centroid) for centroid in centroids_original]
         except Exception:
             # Fallback: return most common positions manually
-            position_counter = Counter(positions)
-            return [pos for pos, count in position_counter.most_common(5)]
+            return self._most_common_positions(positions)
+    
+    def _most_common_positions(self, positions: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        """Return the most frequent exact positions"""
+        position_counter = Counter(positions)
+        return [pos for pos, count in position_counter.most_common(5)]
     
     def _find_common_sizes(self, sizes: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
         """Find common size patterns"""
@@ -517,8 +539,10 @@ class StyleAnalyzer:
         
         for color_hex, frequency in primary_colors[:10]:  # Top 10 colors
             # Convert hex to RGB
-            hex_clean = color_hex.lstrip('#')
-            rgb = tuple(int(hex_clean[i:i+2], 16) for i in (0, 2, 4))
+            rgb = tuple(bytes.fromhex(color_hex.lstrip('#')))
+            if len(rgb) != 3:
+                # fromhex skips whitespace, so a malformed code can decode short
+                raise ValueError(f"Invalid hex color: {color_hex}")
             
             # Determine context (simplified)
             contexts = color_data.get('color_contexts', {}).get(color_hex, ['unknown'])